@@ -6,9 +6,10 @@ Discovers bounded context packages from all source containers
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from pathlib import Path
 
-from practice.bc_discovery import bc_package_dirs, collect_pipelines
+from practice.bc_discovery import collect_all_pipelines
 from practice.entities import Pipeline
 
 
@@ -16,15 +17,15 @@ class CodeSkillsetRepository:
     """Aggregates PIPELINES from all BC package directories."""
 
     def __init__(self, repo_root: Path) -> None:
-        self._pipelines: list[Pipeline] = []
-        for pkg_dir in bc_package_dirs(repo_root):
-            self._pipelines.extend(collect_pipelines(pkg_dir))
+        # Deduplicate by name; the first declaration wins, so a package
+        # reachable from more than one source directory is listed once.
+        self._by_name: dict[str, Pipeline] = {}
+        for p in collect_all_pipelines(repo_root):
+            self._by_name.setdefault(p.name, p)
+        self._pipelines: tuple[Pipeline, ...] = tuple(self._by_name.values())
 
     def get(self, name: str) -> Pipeline | None:
-        for p in self._pipelines:
-            if p.name == name:
-                return p
-        return None
+        return self._by_name.get(name)
 
-    def list_all(self) -> list[Pipeline]:
-        return list(self._pipelines)
+    def list_all(self) -> Sequence[Pipeline]:
+        return self._pipelines
@@ -7,6 +7,8 @@ implementation when partnership discovery is added.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 from practice.repositories import SkillsetRepository
 from practice.entities import SkillsetSource, SourceType
 
@@ -15,25 +17,21 @@ class CommonsSourceRepository:
     """SourceRepository backed by a single commons source."""
 
     def __init__(self, skillsets: SkillsetRepository) -> None:
-        self._skillsets = skillsets
+        self._commons = SkillsetSource(
+            slug="commons",
+            source_type=SourceType.COMMONS,
+            skillset_names=[s.name for s in skillsets.list_all()],
+        )
+        self._sources: tuple[SkillsetSource, ...] = (self._commons,)
+        self._names: frozenset[str] = frozenset(self._commons.skillset_names)
 
     def get(self, slug: str) -> SkillsetSource | None:
         if slug == "commons":
-            return self._commons()
+            return self._commons
         return None
 
-    def list_all(self) -> list[SkillsetSource]:
-        return [self._commons()]
+    def list_all(self) -> Sequence[SkillsetSource]:
+        return self._sources
 
     def skillset_source(self, skillset_name: str) -> str | None:
-        for s in self._skillsets.list_all():
-            if s.name == skillset_name:
-                return "commons"
-        return None
-
-    def _commons(self) -> SkillsetSource:
-        return SkillsetSource(
-            slug="commons",
-            source_type=SourceType.COMMONS,
-            skillset_names=[s.name for s in self._skillsets.list_all()],
-        )
+        return "commons" if skillset_name in self._names else None
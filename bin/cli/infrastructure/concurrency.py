@@ -0,0 +1,22 @@
+"""Worker-count helpers shared by infrastructure that fans out work.
+
+Pool sizes are bounded by the CPUs this process may actually run on,
+which can be far fewer than the host has under an affinity mask or a
+container CPU set.
+"""
+
+from __future__ import annotations
+
+import os
+
+
+def usable_cpu_count() -> int:
+    """Return the number of CPUs available to this process.
+
+    Uses the scheduler affinity mask where the platform exposes one,
+    falling back to ``os.cpu_count()``.
+    """
+    try:
+        return len(os.sched_getaffinity(0)) or 1
+    except AttributeError:
+        return os.cpu_count() or 1
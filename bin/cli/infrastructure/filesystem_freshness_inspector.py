@@ -3,49 +3,138 @@
 Walks the pack directory tree and compares SHA-256 content hashes
 stored in bytecode frontmatter against live source content to
 determine compilation freshness. Stateless — pack_root is passed
-per call.
+per call. Source hashes are memoized per process, keyed on each
+file's (path, mtime_ns, size), so re-assessing an unchanged pack
+costs a stat per item rather than a read and hash.
 """
 
 from __future__ import annotations
 
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from pathlib import Path
 
+from bin.cli.infrastructure.concurrency import usable_cpu_count
 from practice.content_hash import hash_children, hash_content
 from practice.entities import CompilationState, ItemFreshness, PackFreshness
 from practice.frontmatter import split_frontmatter
 
 # Files at the pack root that are not compilable source items.
-_EXCLUDED_NAMES = {"index.md", "summary.md"}
+_EXCLUDED_NAMES = frozenset(("index.md", "summary.md"))
+
+# Upper bound on threads used to assess sibling child packs.
+_MAX_WORKERS = min(8, usable_cpu_count())
+
+# Bytes read from a mirror when looking for its frontmatter.
+_FRONTMATTER_HEAD = 4096
+
+
+@functools.lru_cache(maxsize=4096)
+def _hash_source(path_str: str, mtime_ns: int, size: int) -> str:
+    """Hash a source item. Cached on its stat signature."""
+    return hash_content(Path(path_str).read_text())
+
+
+def _read_head(path_str: str, n: int = _FRONTMATTER_HEAD) -> bytes:
+    """Return the first *n* bytes of a file without a buffered text wrapper."""
+    fd = os.open(path_str, os.O_RDONLY)
+    try:
+        return os.read(fd, n)
+    finally:
+        os.close(fd)
+
+
+def _read_frontmatter_only(path: Path) -> dict[str, str]:
+    """Parse a mirror's frontmatter from the head of the file.
+
+    Falls back to reading the whole file when the closing ``---``
+    is not within the first few KB.
+    """
+    head = _read_head(str(path))
+    opening = head.find(b"---")
+    closing = head.find(b"---", opening + 3) if opening != -1 else -1
+    if closing == -1:
+        meta, _ = split_frontmatter(path.read_text())
+        return meta
+    meta, _ = split_frontmatter(head[: closing + 3].decode())
+    return meta
+
+
+def _source_hash(entry: os.DirEntry[str]) -> str:
+    # DirEntry caches its stat result for the lifetime of the entry.
+    st = entry.stat()
+    return _hash_source(entry.path, st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=1024)
+def _hash_children(dir_str: str, signature: tuple[tuple[str, int, int], ...]) -> str:
+    """Hash a child pack's bytecode. Cached on its files' stat signatures."""
+    return hash_children(Path(dir_str))
+
+
+def _children_hash(bytecode_dir: Path) -> str:
+    signature: list[tuple[str, int, int]] = []
+    with os.scandir(bytecode_dir) as it:
+        for entry in it:
+            if entry.name.endswith(".md") and entry.is_file():
+                st = entry.stat()
+                signature.append((entry.name, st.st_mtime_ns, st.st_size))
+    signature.sort()
+    return _hash_children(str(bytecode_dir), tuple(signature))
 
 
 class FilesystemFreshnessInspector:
     """Assess compilation freshness of a knowledge pack on disk."""
 
     def assess(self, pack_root: Path) -> PackFreshness:
+        return self._assess(pack_root, top=True)
+
+    def _assess_children(
+        self, child_packs: list[Path], *, top: bool
+    ) -> list[PackFreshness]:
+        """Assess child packs, fanning out across threads at the top level only.
+
+        Assessment is stat/read/hash bound, so sibling subtrees overlap
+        well on threads. Nested levels run serially inside the worker
+        that owns them, which keeps the fan-out bounded.
+        """
+        if not top or len(child_packs) < 2:
+            return [self._assess(cp) for cp in child_packs]
+        workers = min(_MAX_WORKERS, len(child_packs))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(self._assess, child_packs))
+
+    def _assess(self, pack_root: Path, *, top: bool = False) -> PackFreshness:
         bytecode_dir = pack_root / "_bytecode"
 
         # --- Discover source items ---
-        source_items: list[Path] = []
+        source_items: list[os.DirEntry[str]] = []
         child_packs: list[Path] = []
 
-        for entry in sorted(pack_root.iterdir()):
-            if entry.name.startswith("_") or entry.name.startswith("."):
+        with os.scandir(pack_root) as it:
+            entries = sorted(it, key=attrgetter("name"))
+
+        for entry in entries:
+            name = entry.name
+            if name.startswith(("_", ".")):
                 continue
             if entry.is_dir():
-                if (entry / "index.md").is_file():
-                    child_packs.append(entry)
+                if os.path.isfile(os.path.join(entry.path, "index.md")):
+                    child_packs.append(Path(entry.path))
                 # Non-pack directories are ignored
                 continue
-            if entry.suffix == ".md" and entry.name not in _EXCLUDED_NAMES:
+            if name.endswith(".md") and name not in _EXCLUDED_NAMES:
                 source_items.append(entry)
 
         # --- ABSENT: no _bytecode/ directory ---
         if not bytecode_dir.is_dir():
             items = [
-                ItemFreshness(name=p.stem, is_composite=False, state="absent")
-                for p in source_items
+                ItemFreshness(name=e.name[:-3], is_composite=False, state="absent")
+                for e in source_items
             ]
-            children = [self.assess(cp) for cp in child_packs]
+            children = self._assess_children(child_packs, top=top)
             items.extend(
                 ItemFreshness(name=cp.name, is_composite=True, state="absent")
                 for cp in child_packs
@@ -57,40 +146,36 @@ class FilesystemFreshnessInspector:
                 children=children,
             )
 
+        with os.scandir(bytecode_dir) as it:
+            bc_entries = sorted(it, key=attrgetter("name"))
+        mirror_names = {e.name for e in bc_entries if e.is_file()}
+
         # --- Assess each leaf item ---
         items: list[ItemFreshness] = []
-        for item_path in source_items:
-            mirror = bytecode_dir / f"{item_path.stem}.md"
-            if not mirror.is_file():
+        for item in source_items:
+            # A mirror shares its source item's file name.
+            stem = item.name[:-3]
+            if item.name not in mirror_names:
                 items.append(
-                    ItemFreshness(
-                        name=item_path.stem, is_composite=False, state="absent"
-                    )
+                    ItemFreshness(name=stem, is_composite=False, state="absent")
                 )
             else:
-                meta, _ = split_frontmatter(mirror.read_text())
-                expected = hash_content(item_path.read_text())
+                meta = _read_frontmatter_only(bytecode_dir / item.name)
+                expected = _source_hash(item)
                 if meta.get("source_hash") == expected:
                     items.append(
-                        ItemFreshness(
-                            name=item_path.stem, is_composite=False, state="clean"
-                        )
+                        ItemFreshness(name=stem, is_composite=False, state="clean")
                     )
                 else:
                     items.append(
-                        ItemFreshness(
-                            name=item_path.stem, is_composite=False, state="dirty"
-                        )
+                        ItemFreshness(name=stem, is_composite=False, state="dirty")
                     )
 
         # --- Assess each composite item (child pack) ---
-        children: list[PackFreshness] = []
-        for child_path in child_packs:
-            child_freshness = self.assess(child_path)
-            children.append(child_freshness)
-
+        children = self._assess_children(child_packs, top=top)
+        for child_path, child_freshness in zip(child_packs, children):
             mirror = bytecode_dir / f"{child_path.name}.md"
-            if not mirror.is_file():
+            if mirror.name not in mirror_names:
                 items.append(
                     ItemFreshness(
                         name=child_path.name, is_composite=True, state="absent"
@@ -107,8 +192,8 @@ class FilesystemFreshnessInspector:
                 # Child is clean — check if parent's hash matches child bytecode
                 child_bytecode = child_path / "_bytecode"
                 if child_bytecode.is_dir():
-                    meta, _ = split_frontmatter(mirror.read_text())
-                    expected = hash_children(child_bytecode)
+                    meta = _read_frontmatter_only(mirror)
+                    expected = _children_hash(child_bytecode)
                     if meta.get("source_hash") == expected:
                         items.append(
                             ItemFreshness(
@@ -133,15 +218,17 @@ class FilesystemFreshnessInspector:
                     )
 
         # --- Check for orphan mirrors ---
-        source_names = {p.stem for p in source_items}
+        source_names = {e.name[:-3] for e in source_items}
         child_names = {p.name for p in child_packs}
         all_known = source_names | child_names
 
-        for bc_file in sorted(bytecode_dir.iterdir()):
-            if bc_file.suffix == ".md" and bc_file.stem not in all_known:
-                items.append(
-                    ItemFreshness(name=bc_file.stem, is_composite=False, state="orphan")
-                )
+        bc_stems = {
+            e.name[:-3]
+            for e in bc_entries
+            if e.name.endswith(".md") and e.name != ".md"
+        }
+        for stem in sorted(bc_stems - all_known):
+            items.append(ItemFreshness(name=stem, is_composite=False, state="orphan"))
 
         # --- Roll up ---
         has_orphan = any(i.state == "orphan" for i in items)
@@ -6,6 +6,7 @@ root: {workspace_root}/{client}/engagements/{engagement}/{project}/{gate_path}
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 
@@ -14,16 +15,18 @@ class FilesystemGateInspector:
 
     def __init__(self, workspace_root: Path) -> None:
         self._workspace_root = workspace_root
+        self._workspace_root_str = str(workspace_root)
 
     def exists(
         self, client: str, engagement: str, project: str, gate_path: str
     ) -> bool:
-        path = (
-            self._workspace_root
-            / client
-            / "engagements"
-            / engagement
-            / project
-            / gate_path
+        return os.path.isfile(
+            os.path.join(
+                self._workspace_root_str,
+                client,
+                "engagements",
+                engagement,
+                project,
+                gate_path,
+            )
         )
-        return path.is_file()
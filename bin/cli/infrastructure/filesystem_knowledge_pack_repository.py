@@ -4,57 +4,149 @@ Scans ``docs/``, ``commons/``, ``personal/``, and each
 ``partnerships/{slug}/`` for ``**/index.md`` files with YAML
 frontmatter containing at least ``name`` and ``purpose``.
 Validates each via ``KnowledgePack.model_validate()``.
+
+Roots that resolve into another root's tree are walked once, and a
+manifest reachable through several links is read once.
+
+Most ``index.md`` files are not pack manifests, so a byte scan of the
+frontmatter block rejects files that cannot contain the required keys
+before any YAML is parsed.
 """
 
 from __future__ import annotations
 
+import functools
+import os
+from collections.abc import Sequence
 from pathlib import Path
+from typing import Any
 
 from pydantic import ValidationError
 
+from practice.bc_discovery import find_named_in, partnership_dirs
 from practice.entities import KnowledgePack
-from practice.frontmatter import parse_frontmatter
+from practice.frontmatter import parse_frontmatter_text
+
+_REQUIRED_KEYS = (b"name", b"purpose")
+
+
+def _may_have_keys(data: bytes, keys: tuple[bytes, ...]) -> bool:
+    """Return False when the frontmatter in *data* cannot hold all *keys*.
+
+    Mirrors the ``---`` split used by :func:`parse_frontmatter`: the
+    block is whatever lies between the first two delimiters.  Only a
+    substring test is made, so quoted or flow-style keys still pass.
+    """
+    start = data.find(b"---")
+    if start < 0:
+        return False
+    end = data.find(b"---", start + 3)
+    if end < 0:
+        return False
+    block = data[start + 3 : end]
+    return all(key in block for key in keys)
+
+
+def _distinct_roots(roots: list[Path]) -> list[Path]:
+    """Drop roots that alias or sit inside another root once resolved.
+
+    Input order is kept, and the first of several identical roots wins.
+    """
+    resolved = [root.resolve() for root in roots]
+    kept: list[Path] = []
+    for i, (root, real) in enumerate(zip(roots, resolved)):
+        if real in resolved[:i]:
+            continue
+        if any(other in real.parents for other in resolved):
+            continue
+        kept.append(root)
+    return kept
+
+
+@functools.lru_cache(maxsize=4096)
+def _manifest_at(path_str: str, mtime_ns: int, size: int) -> dict[str, Any] | None:
+    """Return the frontmatter of a candidate manifest, or None if it is not one.
+
+    Cached on the file's stat signature.  The file is read once; the
+    bytes that pass the prefilter are decoded and parsed as they are.
+    """
+    try:
+        with open(path_str, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    if not _may_have_keys(data, _REQUIRED_KEYS):
+        return None
+    text = data.decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    fm, _ = parse_frontmatter_text(text)
+    if "name" not in fm or "purpose" not in fm:
+        return None
+    return fm
 
 
 class FilesystemKnowledgePackRepository:
-    """Aggregates knowledge pack manifests from version-controlled dirs."""
+    """Aggregates knowledge pack manifests from version-controlled dirs.
+
+    The search roots are walked on first use, not at construction.
+    """
 
     def __init__(self, repo_root: Path) -> None:
-        self._packs: list[tuple[KnowledgePack, Path]] = []
+        self._repo_root = repo_root
+        self._loaded = False
+        self._packs: tuple[tuple[KnowledgePack, Path], ...] = ()
+        self._pack_list: tuple[KnowledgePack, ...] = ()
+        self._by_name: dict[str, KnowledgePack] = {}
+
+    def get(self, name: str) -> KnowledgePack | None:
+        self._ensure_loaded()
+        return self._by_name.get(name)
+
+    def list_all(self) -> Sequence[KnowledgePack]:
+        self._ensure_loaded()
+        return self._pack_list
+
+    def packs_with_paths(self) -> Sequence[tuple[KnowledgePack, Path]]:
+        """Return (pack, pack_root) pairs — used by the nudger."""
+        self._ensure_loaded()
+        return self._packs
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._packs = tuple(self._scan())
+        self._pack_list = tuple(p for p, _ in self._packs)
+        for pack in self._pack_list:
+            self._by_name.setdefault(pack.name, pack)
+        self._loaded = True
+
+    def _scan(self) -> list[tuple[KnowledgePack, Path]]:
+        repo_root = self._repo_root
+        packs: list[tuple[KnowledgePack, Path]] = []
         search_roots: list[Path] = [repo_root / "docs", repo_root / "commons"]
 
         personal = repo_root / "personal"
         if personal.is_dir():
             search_roots.append(personal)
 
-        partnerships = repo_root / "partnerships"
-        if partnerships.is_dir():
-            for child in sorted(partnerships.iterdir()):
-                if child.is_dir():
-                    search_roots.append(child)
-
-        for search_root in search_roots:
-            if not search_root.is_dir():
-                continue
-            for index_md in sorted(search_root.rglob("index.md")):
-                fm = parse_frontmatter(index_md)
-                if "name" not in fm or "purpose" not in fm:
+        search_roots.extend(partnership_dirs(repo_root))
+
+        # Walk the roots concurrently (missing roots yield nothing);
+        # parse and validate on this thread.
+        seen_files: set[tuple[int, int]] = set()
+        for found in find_named_in(_distinct_roots(search_roots), "index.md"):
+            for index_md in found:
+                st = os.stat(index_md)
+                if (st.st_dev, st.st_ino) in seen_files:
+                    continue
+                seen_files.add((st.st_dev, st.st_ino))
+                fm = _manifest_at(str(index_md), st.st_mtime_ns, st.st_size)
+                if fm is None:
                     continue
                 try:
-                    pack = KnowledgePack.model_validate(fm)
+                    pack = KnowledgePack.model_validate(dict(fm))
                 except (ValidationError, TypeError):
                     continue
-                self._packs.append((pack, index_md.parent))
-
-    def get(self, name: str) -> KnowledgePack | None:
-        for pack, _ in self._packs:
-            if pack.name == name:
-                return pack
-        return None
-
-    def list_all(self) -> list[KnowledgePack]:
-        return [pack for pack, _ in self._packs]
-
-    def packs_with_paths(self) -> list[tuple[KnowledgePack, Path]]:
-        """Return (pack, pack_root) pairs — used by the nudger."""
-        return list(self._packs)
+                packs.append((pack, index_md.parent))
+        return packs
@@ -20,7 +20,7 @@ from __future__ import annotations
 from pathlib import Path
 
 from practice.entities import ObservationNeed
-from practice.frontmatter import parse_frontmatter
+from practice.frontmatter import parse_frontmatter_cached
 
 
 class FilesystemNeedsReader:
@@ -59,7 +59,7 @@ class FilesystemNeedsReader:
 
     def _parse_need_file(self, path: Path) -> list[ObservationNeed]:
         """Parse a single needs markdown file into an ObservationNeed."""
-        fm = parse_frontmatter(path)
+        fm = parse_frontmatter_cached(path)
         if not fm or "slug" not in fm:
             return []
         served = fm.get("served", False)
@@ -15,6 +15,7 @@ Path conventions:
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 from practice.entities import Observation, RoutingDestination
@@ -26,16 +27,26 @@ class FilesystemObservationWriter:
     def __init__(self, repo_root: Path, workspace_root: Path) -> None:
         self._repo_root = repo_root
         self._workspace_root = workspace_root
+        self._ensured_dirs: set[Path] = set()
 
     def write(self, observation: Observation) -> None:
-        """Write observation to all resolved destinations."""
+        """Write observation to all resolved destinations.
+
+        The file body does not depend on the destination, so it is
+        rendered once; each observations directory is created at most
+        once per writer.
+        """
+        rendered: bytes | None = None
         for dest in observation.destinations:
             obs_dir = self._destination_dir(dest)
             if obs_dir is None:
                 continue
-            obs_dir.mkdir(parents=True, exist_ok=True)
-            path = obs_dir / f"{observation.slug}.md"
-            path.write_text(self._render(observation))
+            if obs_dir not in self._ensured_dirs:
+                obs_dir.mkdir(parents=True, exist_ok=True)
+                self._ensured_dirs.add(obs_dir)
+            if rendered is None:
+                rendered = self._render(observation).encode("utf-8")
+            _write_file(obs_dir / f"{observation.slug}.md", rendered)
 
     def _destination_dir(self, dest: RoutingDestination) -> Path | None:
         """Resolve the observations directory for a destination."""
@@ -49,14 +60,26 @@ class FilesystemObservationWriter:
 
     def _render(self, observation: Observation) -> str:
         """Render an observation as markdown with frontmatter."""
-        lines = [
-            "---",
-            f"slug: {observation.slug}",
-            f"source_inflection: {observation.source_inflection}",
-            f"need_refs: [{', '.join(observation.need_refs)}]",
-            "---",
-            "",
-            observation.content,
-            "",
-        ]
-        return "\n".join(lines)
+        return (
+            "---\n"
+            f"slug: {observation.slug}\n"
+            f"source_inflection: {observation.source_inflection}\n"
+            f"need_refs: [{', '.join(observation.need_refs)}]\n"
+            "---\n"
+            "\n"
+            f"{observation.content}\n"
+        )
+
+
+def _write_file(path: Path, data: bytes) -> None:
+    """Create or truncate *path* and write *data* with raw fd calls.
+
+    New files get ``0o666`` less the umask, as ``Path.write_text`` gave.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
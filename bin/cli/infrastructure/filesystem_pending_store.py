@@ -6,10 +6,11 @@ Reads and clears markdown observation files from the
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 from practice.entities import Observation
-from practice.frontmatter import parse_frontmatter
+from practice.frontmatter import parse_frontmatter_with_body
 
 
 class FilesystemPendingObservationStore:
@@ -20,23 +21,17 @@ class FilesystemPendingObservationStore:
 
     def read_pending(self, client: str, engagement: str) -> list[Observation]:
         """Read all pending observation files for an engagement."""
-        pending_dir = self._pending_dir(client, engagement)
-        if not pending_dir.is_dir():
-            return []
         results: list[Observation] = []
-        for md_file in sorted(pending_dir.glob("*.md")):
-            obs = self._parse_pending(md_file)
+        for md_path in sorted(_pending_files(self._pending_dir(client, engagement))):
+            obs = self._parse_pending(Path(md_path))
             if obs is not None:
                 results.append(obs)
         return results
 
     def clear_pending(self, client: str, engagement: str) -> None:
         """Remove all .md files from the pending directory."""
-        pending_dir = self._pending_dir(client, engagement)
-        if not pending_dir.is_dir():
-            return
-        for md_file in pending_dir.glob("*.md"):
-            md_file.unlink()
+        for md_path in _pending_files(self._pending_dir(client, engagement)):
+            os.unlink(md_path)
 
     def _pending_dir(self, client: str, engagement: str) -> Path:
         return (
@@ -49,14 +44,10 @@ class FilesystemPendingObservationStore:
 
     def _parse_pending(self, path: Path) -> Observation | None:
         """Parse a pending observation markdown file."""
-        fm = parse_frontmatter(path)
+        fm, body = parse_frontmatter_with_body(path)
         if not fm or "slug" not in fm:
             return None
-
-        # Body is everything after the second ---
-        text = path.read_text()
-        parts = text.split("---", 2)
-        body = parts[2].strip() if len(parts) >= 3 else ""
+        body = body.strip()
 
         need_refs = fm.get("need_refs", [])
         if isinstance(need_refs, str):
@@ -69,3 +60,22 @@ class FilesystemPendingObservationStore:
             content=body,
             destinations=[],  # Resolved at flush time
         )
+
+
+def _pending_files(pending_dir: Path) -> list[str]:
+    """Return paths of the ``*.md`` files in *pending_dir*, unsorted.
+
+    A single ``os.scandir`` pass; a missing directory yields nothing.
+    Symlinks are listed whether or not their target exists, so a
+    dangling link is still cleared.
+    """
+    try:
+        with os.scandir(pending_dir) as it:
+            return [
+                e.path
+                for e in it
+                if e.name.endswith(".md")
+                and (e.is_file(follow_symlinks=False) or e.is_symlink())
+            ]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
@@ -6,90 +6,123 @@ Scans source containers for profile definitions:
 - ``partnerships/{slug}/skillsets/skillset-profiles.json`` (each partnership)
 
 Validates that each profile only references skillsets from its own source.
-Invalid profiles are skipped at load time.
+Invalid profiles are skipped at load time. Parsed files are memoized per
+process on their (path, mtime_ns, size), so repeated repository
+construction does not re-read unchanged files.
 """
 
 from __future__ import annotations
 
-import json
+import functools
+import os
+import stat
+from collections.abc import Sequence
 from pathlib import Path
 
+from pydantic import TypeAdapter, ValidationError
+
+try:
+    from orjson import loads as _loads
+except ImportError:  # orjson is optional; stdlib json parses bytes too
+    from json import loads as _loads
+
+from practice.bc_discovery import commons_repo_dirs, partnership_dirs
 from practice.entities import Profile
 from practice.repositories import SourceRepository
 
+_PROFILES_FILE = "skillset-profiles.json"
+_PROFILE_LIST = TypeAdapter(list[Profile])
+
+
+@functools.lru_cache(maxsize=256)
+def _read_profiles(path_str: str, mtime_ns: int, size: int) -> tuple[Profile, ...]:
+    """Parse a profiles file. Cached on its stat signature."""
+    try:
+        data = _loads(Path(path_str).read_bytes())
+    except (ValueError, OSError):
+        return ()
+
+    # Validate the whole array in one pass; only a file with a bad entry
+    # pays for per-item validation to skip it.
+    try:
+        return tuple(_PROFILE_LIST.validate_python(data))
+    except ValidationError:
+        pass
+
+    profiles: list[Profile] = []
+    for item in data:
+        try:
+            profiles.append(Profile(**item))
+        except Exception:
+            continue
+    return tuple(profiles)
+
 
 class FilesystemProfileRepository:
-    """ProfileRepository backed by skillset-profiles.json files."""
+    """ProfileRepository backed by skillset-profiles.json files.
+
+    Profile files are read on first use, not at construction.
+    """
 
     def __init__(self, repo_root: Path, sources: SourceRepository) -> None:
         self._repo_root = repo_root
         self._sources = sources
-        self._profiles: list[tuple[Profile, str]] = self._load_all()
+        self._loaded = False
+        self._profiles: tuple[tuple[Profile, str], ...] = ()
+        self._by_name: dict[str, tuple[Profile, str]] = {}
 
     def get(self, name: str) -> tuple[Profile, str] | None:
-        for profile, source_slug in self._profiles:
-            if profile.name == name:
-                return (profile, source_slug)
-        return None
+        self._ensure_loaded()
+        return self._by_name.get(name)
+
+    def list_all(self) -> Sequence[tuple[Profile, str]]:
+        self._ensure_loaded()
+        return self._profiles
 
-    def list_all(self) -> list[tuple[Profile, str]]:
-        return list(self._profiles)
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._profiles = tuple(self._load_all())
+        for entry in self._profiles:
+            self._by_name.setdefault(entry[0].name, entry)
+        self._loaded = True
 
     def _load_all(self) -> list[tuple[Profile, str]]:
-        results: list[tuple[Profile, str]] = []
+        # Each source keeps its profiles at a fixed path, so candidates are
+        # probed directly rather than by listing skillsets/ directories.
+        candidates: list[tuple[Path, str]] = []
 
         # Commons: commons/{org}/{repo}/skillsets/skillset-profiles.json
-        commons = self._repo_root / "commons"
-        if commons.is_dir():
-            for org in sorted(commons.iterdir()):
-                if not org.is_dir() or org.name.startswith("."):
-                    continue
-                for repo in sorted(org.iterdir()):
-                    if not repo.is_dir():
-                        continue
-                    path = repo / "skillsets" / "skillset-profiles.json"
-                    results.extend(self._load_file(path, "commons"))
+        for repo in commons_repo_dirs(self._repo_root):
+            candidates.append((repo / "skillsets" / _PROFILES_FILE, "commons"))
 
         # Personal: personal/skillsets/skillset-profiles.json
-        results.extend(
-            self._load_file(
-                self._repo_root / "personal" / "skillsets" / "skillset-profiles.json",
-                "personal",
-            )
+        candidates.append(
+            (self._repo_root / "personal" / "skillsets" / _PROFILES_FILE, "personal")
         )
 
         # Partnerships: partnerships/{slug}/skillsets/skillset-profiles.json
-        partnerships_dir = self._repo_root / "partnerships"
-        if partnerships_dir.is_dir():
-            for subdir in sorted(partnerships_dir.iterdir()):
-                if subdir.is_dir():
-                    results.extend(
-                        self._load_file(
-                            subdir / "skillsets" / "skillset-profiles.json",
-                            subdir.name,
-                        )
-                    )
+        for partner in partnership_dirs(self._repo_root):
+            candidates.append((partner / "skillsets" / _PROFILES_FILE, partner.name))
 
+        results: list[tuple[Profile, str]] = []
+        for path, source_slug in candidates:
+            results.extend(self._load_file(path, source_slug))
         return results
 
     def _load_file(self, path: Path, source_slug: str) -> list[tuple[Profile, str]]:
-        if not path.is_file():
-            return []
-
         try:
-            data = json.loads(path.read_text())
-        except (json.JSONDecodeError, OSError):
+            st = os.stat(path)
+        except OSError:
+            return []
+        if not stat.S_ISREG(st.st_mode):
             return []
 
         source = self._sources.get(source_slug)
         allowed_names = set(source.skillset_names) if source else set()
 
         results: list[tuple[Profile, str]] = []
-        for item in data:
-            try:
-                profile = Profile(**item)
-            except Exception:
-                continue
+        for profile in _read_profiles(str(path), st.st_mtime_ns, st.st_size):
             if all(s in allowed_names for s in profile.skillsets):
                 results.append((profile, source_slug))
 
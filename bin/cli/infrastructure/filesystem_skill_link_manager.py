@@ -17,9 +17,9 @@ from pathlib import Path
 
 from pydantic import ValidationError
 
-from practice.bc_discovery import skill_search_dirs
+from practice.bc_discovery import find_named, skill_search_dirs
 from practice.entities import SkillManifest, SkillType
-from practice.frontmatter import parse_frontmatter
+from practice.frontmatter import parse_frontmatter_cached
 from practice.repositories import SkillLinkStatus, SyncResult
 
 AGENT_SKILL_DIRS = [
@@ -48,8 +48,8 @@ class FilesystemSkillLinkManager:
         """Return {skill_name: (manifest, skill_dir)} for all discovered skills."""
         result: dict[str, tuple[SkillManifest, Path]] = {}
         for search_dir in skill_search_dirs(self._repo_root):
-            for skill_md in sorted(search_dir.rglob("SKILL.md")):
-                fm = parse_frontmatter(skill_md)
+            for skill_md in find_named(search_dir, "SKILL.md"):
+                fm = parse_frontmatter_cached(skill_md)
                 if not fm:
                     continue
                 try:
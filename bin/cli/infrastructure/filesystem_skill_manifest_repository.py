@@ -7,36 +7,55 @@ Invalid manifests are silently skipped.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from pathlib import Path
 
 from pydantic import ValidationError
 
-from practice.bc_discovery import skill_search_dirs
+from practice.bc_discovery import find_named_in, skill_search_dirs
 from practice.entities import SkillManifest
-from practice.frontmatter import parse_frontmatter
+from practice.frontmatter import parse_frontmatter_cached
 
 
 class FilesystemSkillManifestRepository:
-    """Aggregates SKILL.md manifests from all skill search directories."""
+    """Aggregates SKILL.md manifests from all skill search directories.
+
+    The search directories are walked on first use, not at construction.
+    """
 
     def __init__(self, repo_root: Path) -> None:
-        self._manifests: list[SkillManifest] = []
-        for search_dir in skill_search_dirs(repo_root):
-            for skill_md in sorted(search_dir.rglob("SKILL.md")):
-                fm = parse_frontmatter(skill_md)
+        self._repo_root = repo_root
+        self._loaded = False
+        self._manifests: tuple[SkillManifest, ...] = ()
+        self._by_name: dict[str, SkillManifest] = {}
+
+    def get(self, name: str) -> SkillManifest | None:
+        self._ensure_loaded()
+        return self._by_name.get(name)
+
+    def list_all(self) -> Sequence[SkillManifest]:
+        self._ensure_loaded()
+        return self._manifests
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._manifests = tuple(self._scan())
+        for m in self._manifests:
+            self._by_name.setdefault(m.name, m)
+        self._loaded = True
+
+    def _scan(self) -> list[SkillManifest]:
+        manifests: list[SkillManifest] = []
+        # Walk the search dirs concurrently; parse and validate on this thread.
+        for found in find_named_in(skill_search_dirs(self._repo_root), "SKILL.md"):
+            for skill_md in found:
+                fm = parse_frontmatter_cached(skill_md)
                 if not fm:
                     continue
                 try:
                     manifest = SkillManifest.model_validate(fm)
                 except (ValidationError, TypeError):
                     continue
-                self._manifests.append(manifest)
-
-    def get(self, name: str) -> SkillManifest | None:
-        for m in self._manifests:
-            if m.name == name:
-                return m
-        return None
-
-    def list_all(self) -> list[SkillManifest]:
-        return list(self._manifests)
+                manifests.append(manifest)
+        return manifests
@@ -8,15 +8,18 @@ subdirectory:
 - **partnerships** — BC packages in ``{repo_root}/partnerships/{slug}/skillsets/``
 
 All use the same BC package discovery: directories containing
-``__init__.py`` with a ``PIPELINES`` attribute.
+``__init__.py`` with a ``PIPELINES`` attribute. Personal and partnership
+packages are scanned on first use, so commons-only lookups never touch
+those directories.
 """
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from pathlib import Path
 
 from practice.repositories import SkillsetRepository
-from practice.bc_discovery import collect_pipelines
+from practice.bc_discovery import collect_pipelines_by_dir, partnership_dirs
 from practice.entities import SkillsetSource, SourceType
 
 
@@ -26,14 +29,21 @@ class FilesystemSourceRepository:
     def __init__(self, repo_root: Path, commons: SkillsetRepository) -> None:
         self._repo_root = repo_root
         self._commons = commons
-        self._personal = self._scan_personal()
-        self._partnerships = self._scan_partnerships()
+        self._loaded = False
+        self._personal: list[str] = []
+        self._partnerships: dict[str, list[str]] = {}
+        self._sources: tuple[SkillsetSource, ...] = ()
+        self._commons_names: list[str] | None = None
+        self._commons_name_set: frozenset[str] = frozenset()
+        self._commons_entry: SkillsetSource | None = None
+        self._skillset_to_source: dict[str, str] = {}
 
     # -- SourceRepository protocol ------------------------------------------
 
     def get(self, slug: str) -> SkillsetSource | None:
         if slug == "commons":
             return self._commons_source()
+        self._ensure_loaded()
         if slug == "personal":
             return self._personal_source()
         if slug in self._partnerships:
@@ -44,7 +54,48 @@ class FilesystemSourceRepository:
             )
         return None
 
-    def list_all(self) -> list[SkillsetSource]:
+    def list_all(self) -> Sequence[SkillsetSource]:
+        self._ensure_loaded()
+        return self._sources
+
+    def skillset_source(self, skillset_name: str) -> str | None:
+        self._commons_skillset_names()
+        if skillset_name in self._commons_name_set:
+            return "commons"
+        self._ensure_loaded()
+        return self._skillset_to_source.get(skillset_name)
+
+    # -- Internals ----------------------------------------------------------
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._personal, self._partnerships = self._scan_sources()
+        self._sources = self._build_sources()
+        self._skillset_to_source = self._index_sources()
+        self._loaded = True
+
+    def _scan_sources(self) -> tuple[list[str], dict[str, list[str]]]:
+        """Scan personal and partnership ``skillsets/`` dirs in one batch.
+
+        Returns personal pipeline names and a slug -> names mapping for
+        partnerships that provide at least one pipeline.
+        """
+        partners = partnership_dirs(self._repo_root)
+        groups = collect_pipelines_by_dir(
+            [self._repo_root / "personal" / "skillsets"]
+            + [d / "skillsets" for d in partners]
+        )
+        personal = [s.name for s in groups[0]]
+        partnerships = {
+            d.name: [s.name for s in group]
+            for d, group in zip(partners, groups[1:])
+            if group
+        }
+        return personal, partnerships
+
+    def _build_sources(self) -> tuple[SkillsetSource, ...]:
+        """Assemble the merged source list once, on first use."""
         sources = [self._commons_source()]
         personal = self._personal_source()
         if personal.skillset_names:
@@ -57,46 +108,39 @@ class FilesystemSourceRepository:
                     skillset_names=names,
                 )
             )
-        return sources
-
-    def skillset_source(self, skillset_name: str) -> str | None:
-        for s in self._commons.list_all():
-            if s.name == skillset_name:
-                return "commons"
-        if skillset_name in self._personal:
-            return "personal"
+        return tuple(sources)
+
+    def _index_sources(self) -> dict[str, str]:
+        """Map each personal and partnership skillset name to its source.
+
+        The first source to provide a name wins, matching the personal
+        then partnership order of :meth:`list_all`.  Commons names are
+        answered from ``_commons_name_set`` before this index is built.
+        """
+        index: dict[str, str] = {}
+        for name in self._personal:
+            index.setdefault(name, "personal")
         for slug, names in self._partnerships.items():
-            if skillset_name in names:
-                return slug
-        return None
-
-    # -- Internals ----------------------------------------------------------
+            for name in names:
+                index.setdefault(name, slug)
+        return index
 
-    def _scan_personal(self) -> list[str]:
-        """Scan personal/skillsets/ for BC packages, returning pipeline names."""
-        skillsets = collect_pipelines(self._repo_root / "personal" / "skillsets")
-        return [s.name for s in skillsets]
-
-    def _scan_partnerships(self) -> dict[str, list[str]]:
-        """Scan partnerships/{slug}/skillsets/ for BC packages."""
-        result: dict[str, list[str]] = {}
-        partnerships_dir = self._repo_root / "partnerships"
-        if not partnerships_dir.is_dir():
-            return result
-        for subdir in sorted(partnerships_dir.iterdir()):
-            if not subdir.is_dir():
-                continue
-            skillsets = collect_pipelines(subdir / "skillsets")
-            if skillsets:
-                result[subdir.name] = [s.name for s in skillsets]
-        return result
+    def _commons_skillset_names(self) -> list[str]:
+        """Return commons pipeline names, read from the repository once."""
+        if self._commons_names is None:
+            self._commons_names = [s.name for s in self._commons.list_all()]
+            self._commons_name_set = frozenset(self._commons_names)
+        return self._commons_names
 
     def _commons_source(self) -> SkillsetSource:
-        return SkillsetSource(
-            slug="commons",
-            source_type=SourceType.COMMONS,
-            skillset_names=[s.name for s in self._commons.list_all()],
-        )
+        """Return the commons source, built once and shared with list_all."""
+        if self._commons_entry is None:
+            self._commons_entry = SkillsetSource(
+                slug="commons",
+                source_type=SourceType.COMMONS,
+                skillset_names=self._commons_skillset_names(),
+            )
+        return self._commons_entry
 
     def _personal_source(self) -> SkillsetSource:
         return SkillsetSource(
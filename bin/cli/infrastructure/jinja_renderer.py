@@ -8,14 +8,23 @@ markdown library.
 
 from __future__ import annotations
 
+import contextlib
+import functools
+import hashlib
+import io
+import os
 import re
 import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 
 import markdown
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 from markupsafe import Markup
 
+from bin.cli.infrastructure.concurrency import usable_cpu_count
 from practice.content import Figure, NarrativePage, ProjectContribution, ProjectSection
 from practice.entities import ResearchTopic
 
@@ -24,83 +33,174 @@ from practice.entities import ResearchTopic
 # Markdown helpers
 # ---------------------------------------------------------------------------
 
-
-def _preprocess_trees(text):
-    """Fence box-drawing character runs in code blocks."""
-    box_chars = re.compile(r"[├│└─┌┐┬┤┼┘┴]")
-    lines = text.split("\n")
+_BOX_CHARS_RE = re.compile(r"[├│└─┌┐┬┤┼┘┴]")
+_KV_RE = re.compile(r"^\*\*[^*]+\*\*:")
+_LIST_RE = re.compile(r"^(\s*[-*+]|\s*\d+\.) ")
+_H1_RE = re.compile(r"^#\s+(.+)$", re.MULTILINE)
+_STRIP_H1_RE = re.compile(r"<h1[^>]*>.*?</h1>", re.DOTALL)
+# ``[^\S\n]`` keeps the match on the heading line under MULTILINE.
+_ORG_NAME_RE = re.compile(r"^#.*—[^\S\n]*(.+)$", re.MULTILINE)
+# Characters a ``_LIST_RE`` match can start with, besides whitespace
+# and decimal digits; checked before running the regex.
+_LIST_MARKERS = frozenset("-*+")
+
+# Building a Markdown instance registers every extension, so one is kept
+# and reset between documents.  Rendering is single-threaded per process.
+_MARKDOWN = markdown.Markdown(extensions=["tables", "fenced_code"])
+
+
+def _preprocess_all(text):
+    """Normalise markdown spacing and fence box-drawing trees in one pass.
+
+    - A blank line is inserted before a ``**Label**:`` line that follows
+      a non-blank line.
+    - A blank line is inserted before the first list item after a
+      paragraph; indented continuations and blank lines keep the list
+      open.
+    - Runs of lines containing box-drawing characters outside fenced
+      code are wrapped in a code fence.
+    """
     out = []
     in_fence = False
     in_tree = False
-    for line in lines:
+    in_list = False
+    prev_nonblank = False
+    for line in text.split("\n"):
+        stripped = line.strip()
+        first = line[:1]
+
+        # Blank-line insertion (key/value labels, then list starts)
+        insert_blank = False
+        if prev_nonblank and line.startswith("**") and _KV_RE.match(line):
+            insert_blank = True
+            prev_nonblank = False
+        if (
+            first in _LIST_MARKERS or first.isspace() or first.isdecimal()
+        ) and _LIST_RE.match(line):
+            if not in_list and prev_nonblank:
+                insert_blank = True
+            in_list = True
+        elif not (in_list and (not stripped or line.startswith("  "))):
+            in_list = False
+        if insert_blank:
+            if in_tree and not in_fence:
+                out.append("```")
+                in_tree = False
+            out.append("")
+        prev_nonblank = bool(stripped)
+
+        # Tree fencing
         if line.startswith("```"):
             if in_tree:
                 out.append("```")
                 in_tree = False
             in_fence = not in_fence
-            out.append(line)
-            continue
-        if in_fence:
-            out.append(line)
-            continue
-        if box_chars.search(line):
-            if not in_tree:
-                out.append("```")
-                in_tree = True
-            out.append(line)
-        else:
-            if in_tree:
+        elif not in_fence:
+            # Box-drawing characters are non-ASCII, and isascii() is O(1)
+            if not line.isascii() and _BOX_CHARS_RE.search(line):
+                if not in_tree:
+                    out.append("```")
+                    in_tree = True
+            elif in_tree:
                 out.append("```")
                 in_tree = False
-            out.append(line)
+        out.append(line)
     if in_tree:
         out.append("```")
     return "\n".join(out)
 
 
-def _preprocess_kv(text):
-    """Insert blank line before **Label**: lines that follow non-blank lines."""
-    lines = text.split("\n")
-    out = []
-    kv_re = re.compile(r"^\*\*[^*]+\*\*:")
-    for i, line in enumerate(lines):
-        if kv_re.match(line) and i > 0 and lines[i - 1].strip():
-            out.append("")
-        out.append(line)
-    return "\n".join(out)
+def _drop_leading_h1(text):
+    """Blank the first non-empty line when it is an ATX level-1 heading.
 
+    Returns ``(text, dropped)``.  Documents usually open with their
+    title, and dropping it from the source spares a search of the
+    generated HTML.  Python-markdown accepts ``#Title`` without a space,
+    so any single leading ``#`` counts.  Lines holding only whitespace
+    are not skipped, because markdown may read them as content.
+    """
+    start = 0
+    while True:
+        end = text.find("\n", start)
+        line = text[start:] if end < 0 else text[start:end]
+        if line:
+            break
+        if end < 0:
+            return text, False
+        start = end + 1
+    if not line.startswith("#") or line.startswith("##"):
+        return text, False
+    # Keep the newline so the following line still reads as a new line.
+    return text[:start] + ("" if end < 0 else text[end:]), True
+
+
+@functools.lru_cache(maxsize=1024)
+def _md_to_html(text):
+    """Preprocess and convert markdown to HTML, stripping the first H1.
 
-def _preprocess_lists(text):
-    """Insert blank line before the first list item after a paragraph."""
-    lines = text.split("\n")
-    out = []
-    list_re = re.compile(r"^(\s*[-*+]|\s*\d+\.) ")
-    in_list = False
-    for i, line in enumerate(lines):
-        is_list_item = bool(list_re.match(line))
-        is_continuation = not is_list_item and line.startswith("  ") and line.strip()
-        if is_list_item:
-            if not in_list and i > 0 and lines[i - 1].strip():
-                out.append("")
-            in_list = True
-        elif is_continuation and in_list:
-            pass
-        elif not line.strip() and in_list:
-            pass
-        else:
-            in_list = False
-        out.append(line)
-    return "\n".join(out)
+    Memoized on the source text: engagement prose, captions and shared
+    overviews are rendered into several pages.
+    """
+    if not text or text.isspace():
+        return ""
+    text, dropped_h1 = _drop_leading_h1(_preprocess_all(text))
+    html = _MARKDOWN.reset().convert(text)
+    if not dropped_h1 and "<h1" in html:
+        html = _STRIP_H1_RE.sub("", html, count=1)
+    return html.strip()
 
 
-def _md_to_html(text):
-    """Preprocess and convert markdown to HTML, stripping the first H1."""
-    text = _preprocess_kv(text)
-    text = _preprocess_lists(text)
-    text = _preprocess_trees(text)
-    html = markdown.markdown(text, extensions=["tables", "fenced_code"])
-    html = re.sub(r"<h1[^>]*>.*?</h1>", "", html, count=1, flags=re.DOTALL)
-    return html.strip()
+@functools.lru_cache(maxsize=1)
+def _md_cache_seed():
+    """Return the hash state every cache key starts from.
+
+    It covers this module's source and the markdown version, so changing
+    the conversion pipeline starts a fresh set of entries.  Computed on
+    first use rather than at import.
+    """
+    return hashlib.blake2b(
+        Path(__file__).read_bytes() + markdown.__version__.encode(), digest_size=16
+    )
+
+
+def _md_cache_name(text):
+    """Return the cache entry file name for markdown *text*."""
+    h = _md_cache_seed().copy()
+    h.update(text.encode("utf-8"))
+    return f"{h.hexdigest()}.html"
+
+
+def _md_to_html_cached(text, entry):
+    """Convert markdown through the on-disk cache entry at *entry*.
+
+    Sites are rebuilt from scratch on every render, so unchanged prose
+    would otherwise go through the markdown library again each time.
+    A cache that cannot be read or written just falls back to converting.
+    """
+    try:
+        with open(entry, "rb") as f:
+            return f.read().decode("utf-8")
+    except (OSError, UnicodeDecodeError):
+        pass
+    html = _md_to_html(text)
+    # Write then rename, so a concurrent worker never reads a partial entry.
+    tmp = entry.with_name(f"{entry.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(html.encode("utf-8"))
+        os.replace(tmp, entry)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+    return html
+
+
+def _prune_md_cache(cache_dir, keep):
+    """Delete entries in *cache_dir* whose names are not in *keep*."""
+    for entry in _scan(cache_dir):
+        if entry.name not in keep:
+            with contextlib.suppress(OSError):
+                os.unlink(entry.path)
 
 
 # ---------------------------------------------------------------------------
@@ -108,20 +208,78 @@ def _md_to_html(text):
 # ---------------------------------------------------------------------------
 
 
+def _read_text(path):
+    """Read a UTF-8 text file as bytes and decode it once.
+
+    Line endings are normalised to ``\\n`` as text-mode reads did.
+    """
+    with open(path, "rb") as f:
+        text = f.read().decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _read_optional(path):
+    """Read a text file, or return None when it is not a regular file."""
+    try:
+        return _read_text(path)
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        return None
+
+
 def _read_md(path):
     """Read a markdown file and return its text, or empty string."""
-    p = Path(path)
-    if p.is_file():
-        return p.read_text()
-    return ""
+    return _read_optional(path) or ""
+
+
+def _scan(directory):
+    """Return the entries of *directory*, or an empty list if it is absent."""
+    try:
+        with os.scandir(directory) as it:
+            return list(it)
+    except (FileNotFoundError, NotADirectoryError):
+        return []
 
 
 def _extract_h1(text):
     """Extract the first H1 text from markdown."""
-    m = re.search(r"^#\s+(.+)$", text, re.MULTILINE)
+    m = _H1_RE.search(text)
     return m.group(1).strip() if m else ""
 
 
+def _link_project_names(html, project_names):
+    """Link bare project names and ``name: …`` headings to project pages.
+
+    One regex pass per pattern covers every project name.
+    """
+    names = "|".join(re.escape(n) for n in project_names)
+    html = re.sub(
+        f">({names})<",
+        lambda m: f'><a href="{m.group(1)}/index.html">{m.group(1)}</a><',
+        html,
+    )
+    return re.sub(
+        rf"(<h[23]>)({names})(:.+?)(</h[23]>)",
+        lambda m: (
+            f'{m.group(1)}<a href="{m.group(2)}/index.html">'
+            f"{m.group(2)}{m.group(3)}</a>{m.group(4)}"
+        ),
+        html,
+    )
+
+
+_SVG_STYLED_OPEN = '<svg style="max-width:100%;height:auto" '
+
+
+def _style_svg(svg):
+    """Make an inline SVG scale to its container."""
+    if svg.startswith("<svg "):
+        # Common case: no XML prolog, so the tag is at the start.
+        return _SVG_STYLED_OPEN + svg[5:]
+    return svg.replace("<svg ", _SVG_STYLED_OPEN, 1)
+
+
 def _title_case(slug):
     """Convert a slug like 'shared-components' to 'Shared Components'."""
     return " ".join(w.capitalize() for w in slug.split("-"))
@@ -182,17 +340,103 @@ def _build_project_nav(active, depth, sections):
     return items
 
 
+def _toc_builder(entries, keys):
+    """Return ``toc(active_key=None)`` over prebuilt inactive *entries*.
+
+    *keys* gives each entry's key.  Each call copies the entry list and
+    swaps in fresh dicts only for the active entries, so a section of P
+    pages costs O(P) pointer copies per page rather than P new dicts.
+    """
+    positions = {}
+    for i, key in enumerate(keys):
+        positions.setdefault(key, []).append(i)
+
+    def toc(active_key=None):
+        result = list(entries)
+        for i in positions.get(active_key, ()):
+            result[i] = {**entries[i], "active": True}
+        return result
+
+    return toc
+
+
 # ---------------------------------------------------------------------------
-# Render helper
+# Parallel project rendering
 # ---------------------------------------------------------------------------
 
+_MAX_WORKERS = 8
+
+# Uncached markdown, in bytes, a site needs before projects go to the
+# pool.  Conversion runs at roughly 1.5 µs per byte, so this is a second
+# or more of serial work, enough to pay for starting workers even where
+# they are spawned rather than forked.
+_POOL_MIN_MARKDOWN_BYTES = 1 << 20
 
-def _render_page(env, template_name, output_path, **ctx):
-    """Render a template to a file."""
-    tmpl = env.get_template(template_name)
-    html = tmpl.render(**ctx)
-    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    Path(output_path).write_text(html)
+
+def _contribution_markdown(contrib):
+    """Yield every markdown text rendered for *contrib*."""
+    yield contrib.overview_md
+    for section in contrib.sections:
+        for page in section.pages:
+            yield page.body_md
+        for group in section.groups:
+            for page in group.pages:
+                yield page.body_md
+        for narrative in section.narratives:
+            yield narrative.opening_md
+            for group in narrative.groups:
+                yield group.transition_md
+                for stop in group.stops:
+                    yield stop.analysis_md
+
+
+def _worth_pooling(contributions, md_cache_dir):
+    """True when the markdown still to convert outweighs pool start-up.
+
+    Text already in the markdown cache costs a file read, so only
+    uncached text counts; the scan stops once the threshold is reached.
+    """
+    pending = 0
+    seen = set()
+    for contrib in contributions:
+        for text in _contribution_markdown(contrib):
+            if not text or text in seen:
+                continue
+            seen.add(text)
+            if os.path.exists(md_cache_dir / _md_cache_name(text)):
+                continue
+            pending += len(text)
+            if pending >= _POOL_MIN_MARKDOWN_BYTES:
+                return True
+    return False
+
+
+# Template events joined per streamed chunk, and the page file buffer size.
+_STREAM_CHUNK = 64
+_WRITE_BUFFER = 1 << 16
+
+# One renderer per worker process, so its Jinja environment stays warm
+# across the projects that worker is given.
+_worker_renderers: dict[tuple[Path, Path], JinjaSiteRenderer] = {}
+
+
+def _render_contribution_in_worker(
+    workspace_root, repo_root, md_cache_dir, contrib, site_dir, org
+):
+    """Process-pool entry point: render one project.
+
+    Returns its log and the markdown cache entries it used.
+    """
+    key = (workspace_root, repo_root)
+    renderer = _worker_renderers.get(key)
+    if renderer is None:
+        renderer = _worker_renderers[key] = JinjaSiteRenderer(workspace_root, repo_root)
+    # The site tree may have been rebuilt since this worker last ran.
+    renderer.reset_render_state(md_cache_dir, site_dir)
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        renderer._render_contribution(contrib, site_dir, org)
+    return log.getvalue(), renderer._md_cache_used
 
 
 # ---------------------------------------------------------------------------
@@ -206,12 +450,37 @@ class JinjaSiteRenderer:
     Constructed with workspace and repo paths. The render() method
     receives structured data from the usecase and reads prose content
     directly from the workspace filesystem.
+
+    One Jinja environment is built per renderer and reused, so
+    templates compiled for one page or client stay loaded for the next.
+    Compiled template bytecode is also cached in ``.jinja-cache`` under
+    the workspace root, so templates are only parsed when their source
+    changes.  The cache is set up on the first render, and rendering
+    goes on without it if the directory cannot be used.
+    Converted markdown is kept in ``.md-cache/{client}`` under the
+    workspace root, keyed on its source text, so unchanged prose is read
+    back rather than converted again on the next render.  Each render
+    prunes the entries it did not use.
+    Projects are independent once their directories exist, so sites
+    with several projects and enough uncached markdown render them in a
+    process pool; smaller sites render serially.
     """
 
     def __init__(self, workspace_root: Path, repo_root: Path) -> None:
         self._ws_root = workspace_root
+        self._repo_root = repo_root
         self._template_dir = repo_root / "bin" / "templates"
         self._css_file = repo_root / "bin" / "site.css"
+        self._env = Environment(
+            loader=FileSystemLoader(str(self._template_dir)),
+            autoescape=False,
+            auto_reload=False,
+        )
+        self._bytecode_cache_checked = False
+        self._md_cache_dir: Path | None = None
+        self._md_cache_used: set[str] = set()
+        self._dirs_created: set[Path] = set()
+        self._log_lines: list[str] = []
 
     # -- Public interface --------------------------------------------------
 
@@ -224,62 +493,155 @@ class JinjaSiteRenderer:
         ws = self._ws_root / client
         site = ws / "site"
 
-        env = Environment(
-            loader=FileSystemLoader(str(self._template_dir)),
-            autoescape=False,
-        )
-
-        org_name = self._extract_org_name(ws, client)
+        engagement_text = _read_optional(ws / "engagement.md")
+        org_name = self._extract_org_name(engagement_text, client)
 
         if site.exists():
             shutil.rmtree(site)
         site.mkdir(parents=True)
         (site / "resources").mkdir()
-        shutil.copy(self._css_file, site / "style.css")
+        md_cache_dir = self._ws_root / ".md-cache" / client
+        md_cache_dir.mkdir(parents=True, exist_ok=True)
+        self.reset_render_state(md_cache_dir, site, site / "resources")
+        shutil.copyfile(self._css_file, site / "style.css")
 
         print(f"Workspace: {ws} ({org_name})")
         print("Generating client pages...")
 
-        self._render_client_pages(ws, site, env, org_name, research_topics)
+        self._render_client_pages(
+            ws, site, self._env, org_name, research_topics, engagement_text
+        )
 
-        for contrib in contributions:
-            site_proj_dir = site / contrib.slug
-            site_proj_dir.mkdir(parents=True, exist_ok=True)
+        site_proj_dirs = [site / contrib.slug for contrib in contributions]
+        for site_proj_dir in site_proj_dirs:
+            self._ensure_dir(site_proj_dir)
+
+        workers = min(len(contributions), usable_cpu_count(), _MAX_WORKERS)
+        if workers > 1 and _worth_pooling(contributions, md_cache_dir):
+            # Worker logs are written in project order as they complete.
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for log, used in pool.map(
+                    _render_contribution_in_worker,
+                    repeat(self._ws_root),
+                    repeat(self._repo_root),
+                    repeat(md_cache_dir),
+                    contributions,
+                    site_proj_dirs,
+                    repeat(org_name),
+                ):
+                    sys.stdout.write(log)
+                    self._md_cache_used |= used
+        else:
+            for contrib, site_proj_dir in zip(contributions, site_proj_dirs):
+                self._render_contribution(contrib, site_proj_dir, org_name)
 
-            print(f"\nProject: {contrib.slug}")
-            self._render_project_from_contribution(
-                contrib, site_proj_dir, org_name, env
-            )
+        # Entries this render did not use belong to edited or deleted prose.
+        _prune_md_cache(md_cache_dir, self._md_cache_used)
 
         print(f"\nSite generated: {site}/")
         return site
 
+    def reset_render_state(self, md_cache_dir, *created_dirs):
+        """Start a render, forgetting state left by any earlier one.
+
+        *md_cache_dir* holds this client's converted markdown, and
+        *created_dirs* are output directories that already exist.  The
+        first call also sets up the template bytecode cache.
+        """
+        self._ensure_bytecode_cache()
+        self._md_cache_dir = md_cache_dir
+        self._md_cache_used = set()
+        self._dirs_created = set(created_dirs)
+        self._log_lines = []
+
     # -- Internal helpers --------------------------------------------------
 
-    def _extract_org_name(self, ws, client):
+    def _ensure_bytecode_cache(self):
+        """Attach the workspace bytecode cache to the environment once.
+
+        Left off when the cache directory cannot be created or used, so
+        a bad cache location only costs template compile time.
+        """
+        if self._bytecode_cache_checked:
+            return
+        self._bytecode_cache_checked = True
+        cache_dir = self._ws_root / ".jinja-cache"
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            self._env.bytecode_cache = FileSystemBytecodeCache(str(cache_dir))
+        except (RuntimeError, OSError):
+            self._env.bytecode_cache = None
+
+    def _render_contribution(self, contrib, site_proj_dir, org_name):
+        self._log(f"\nProject: {contrib.slug}")
+        self._render_project_from_contribution(
+            contrib, site_proj_dir, org_name, self._env
+        )
+
+    def _log(self, line):
+        """Queue a progress line; see :meth:`_flush_log`."""
+        self._log_lines.append(line)
+
+    def _flush_log(self):
+        """Write queued progress lines to stdout in a single call."""
+        if self._log_lines:
+            sys.stdout.write("\n".join(self._log_lines) + "\n")
+            self._log_lines.clear()
+
+    def _md_html(self, text):
+        """Convert markdown to HTML through the workspace markdown cache."""
+        if not text or text.isspace():
+            return ""
+        name = _md_cache_name(text)
+        self._md_cache_used.add(name)
+        return _md_to_html_cached(text, self._md_cache_dir / name)
+
+    def _ensure_dir(self, path):
+        """Create *path* unless this render has already created it."""
+        if path not in self._dirs_created:
+            path.mkdir(parents=True, exist_ok=True)
+            self._dirs_created.add(path)
+
+    def _render_page(self, env, template_name, output_path, **ctx):
+        """Render a template to a file."""
+        tmpl = env.get_template(template_name)
+        output_path = Path(output_path)
+        self._ensure_dir(output_path.parent)
+        # Stream the page to disk in encoded chunks rather than building
+        # the whole document as one string first.
+        stream = tmpl.stream(**ctx)
+        stream.enable_buffering(_STREAM_CHUNK)
+        with open(output_path, "wb", buffering=_WRITE_BUFFER) as f:
+            stream.dump(f, encoding="utf-8")
+
+    def _extract_org_name(self, engagement_text, client):
         """Derive display name from engagement.md or fall back to slug."""
-        eng_path = ws / "engagement.md"
-        if eng_path.is_file():
-            for line in eng_path.read_text().split("\n"):
-                m = re.search(r"^#.*—\s*(.+)$", line)
-                if m:
-                    return m.group(1).strip()
+        if engagement_text is not None:
+            m = _ORG_NAME_RE.search(engagement_text)
+            if m:
+                return m.group(1).strip()
         return client
 
     # -- Client pages ------------------------------------------------------
 
-    def _render_client_pages(self, ws, site, env, org_name, research_topics):
+    def _render_client_pages(
+        self, ws, site, env, org_name, research_topics, engagement_text=None
+    ):
+        """Render client-level pages.
+
+        *engagement_text* is the content of ``engagement.md``, or None
+        when the workspace has none; render() reads it once.
+        """
         ws = Path(ws)
         site = Path(site)
-        has_engagement = (ws / "engagement.md").is_file()
+        has_engagement = engagement_text is not None
 
         # Home page
         content_parts = []
-        engagement_text = _read_md(ws / "engagement.md")
         if engagement_text:
-            content_parts.append(_md_to_html(engagement_text))
+            content_parts.append(self._md_html(engagement_text))
 
-        _render_page(
+        self._render_page(
             env,
             "base.html",
             site / "index.html",
@@ -295,29 +657,16 @@ class JinjaSiteRenderer:
 
         # Projects page
         projects_md = _read_md(ws / "projects" / "index.md")
-        project_dirs = (
-            sorted(
-                p.name
-                for p in (ws / "projects").iterdir()
-                if p.is_dir() and p.name != "site"
-            )
-            if (ws / "projects").is_dir()
-            else []
+        project_dirs = sorted(
+            e.name for e in _scan(ws / "projects") if e.is_dir() and e.name != "site"
         )
 
-        projects_html = _md_to_html(projects_md) if projects_md else ""
+        projects_html = self._md_html(projects_md)
 
-        for pname in project_dirs:
-            projects_html = projects_html.replace(
-                f">{pname}<", f'><a href="{pname}/index.html">{pname}</a><'
-            )
-            projects_html = re.sub(
-                rf"(<h[23]>)({re.escape(pname)})(:.+?)(</h[23]>)",
-                rf'\1<a href="{pname}/index.html">\2\3</a>\4',
-                projects_html,
-            )
+        if project_dirs and projects_html:
+            projects_html = _link_project_names(projects_html, project_dirs)
 
-        _render_page(
+        self._render_page(
             env,
             "base.html",
             site / "projects.html",
@@ -333,23 +682,31 @@ class JinjaSiteRenderer:
 
         # Research pages — use structured topics for TOC, fall back to
         # filesystem scan if no topics registered
+        # Each entry keeps the report text, so every file is read once.
+        research_files = []
         if research_topics:
-            research_files = []
             for rt in research_topics:
                 rf = ws / "resources" / rt.filename
-                if rf.is_file():
-                    research_files.append((rf, rt.topic))
+                text = _read_optional(rf)
+                if text is not None:
+                    research_files.append((rf, rt.topic, text))
         else:
-            research_files = [
-                (p, _extract_h1(p.read_text()) or _title_case(p.stem))
-                for p in sorted((ws / "resources").glob("*.md"))
-                if p.name != "index.md"
-            ]
+            names = sorted(
+                e.name
+                for e in _scan(ws / "resources")
+                if e.name.endswith(".md") and e.name != "index.md" and e.is_file()
+            )
+            for name in names:
+                rf = ws / "resources" / name
+                text = _read_text(rf)
+                research_files.append(
+                    (rf, _extract_h1(text) or _title_case(rf.stem), text)
+                )
 
         research_toc_entries = [
             {"label": "Synthesis", "url": "resources.html", "active": False}
         ]
-        for rf, title in research_files:
+        for rf, title, _ in research_files:
             slug = rf.stem
             research_toc_entries.append(
                 {"label": title, "url": f"resources/{slug}.html", "active": False}
@@ -360,7 +717,7 @@ class JinjaSiteRenderer:
             dict(e, active=(e["label"] == "Synthesis")) for e in research_toc_entries
         ]
         synth_md = _read_md(ws / "resources" / "index.md")
-        _render_page(
+        self._render_page(
             env,
             "base.html",
             site / "resources.html",
@@ -371,12 +728,16 @@ class JinjaSiteRenderer:
             breadcrumb=_build_breadcrumb((org_name, "index.html"), ("Research",)),
             nav=_build_client_nav("resources", has_engagement),
             toc=synth_toc,
-            content=Markup(_md_to_html(synth_md)),
+            content=Markup(self._md_html(synth_md)),
         )
-        print("  resources.html")
+        self._log("  resources.html")
 
         # Sub-report pages
-        for rf, title in research_files:
+        sub_nav = [
+            {**item, "url": f"../{item['url']}"}
+            for item in _build_client_nav("resources", has_engagement)
+        ]
+        for rf, title, text in research_files:
             slug = rf.stem
             sub_toc = []
             for e in research_toc_entries:
@@ -388,12 +749,7 @@ class JinjaSiteRenderer:
                     entry["url"] = entry["url"].replace("resources/", "")
                 sub_toc.append(entry)
 
-            sub_nav = [
-                {**item, "url": f"../{item['url']}"}
-                for item in _build_client_nav("resources", has_engagement)
-            ]
-
-            _render_page(
+            self._render_page(
                 env,
                 "base.html",
                 site / "resources" / f"{slug}.html",
@@ -408,14 +764,13 @@ class JinjaSiteRenderer:
                 ),
                 nav=sub_nav,
                 toc=sub_toc,
-                content=Markup(_md_to_html(rf.read_text())),
+                content=Markup(self._md_html(text)),
             )
-            print(f"  resources/{slug}.html")
+            self._log(f"  resources/{slug}.html")
 
         # Engagement page
         if has_engagement:
-            eng_md = _read_md(ws / "engagement.md")
-            _render_page(
+            self._render_page(
                 env,
                 "base.html",
                 site / "engagement.html",
@@ -426,22 +781,21 @@ class JinjaSiteRenderer:
                 breadcrumb=_build_breadcrumb((org_name, "index.html"), ("History",)),
                 nav=_build_client_nav("engagement", has_engagement),
                 toc=None,
-                content=Markup(_md_to_html(eng_md)),
+                content=Markup(self._md_html(engagement_text)),
             )
-            print("  engagement.html")
+            self._log("  engagement.html")
+        self._flush_log()
 
     # -- Contribution-based rendering --------------------------------------
 
     def _figure_to_html(self, figure: Figure) -> str:
         """Convert a Figure entity to <figure> HTML."""
-        svg = figure.svg_content.replace(
-            "<svg ", '<svg style="max-width:100%;height:auto" ', 1
-        )
-        parts = ["<figure>", svg]
+        svg = _style_svg(figure.svg_content)
         if figure.caption:
-            parts.append(f"<figcaption>{figure.caption}</figcaption>")
-        parts.append("</figure>")
-        return "\n".join(parts)
+            return (
+                f"<figure>\n{svg}\n<figcaption>{figure.caption}</figcaption>\n</figure>"
+            )
+        return f"<figure>\n{svg}\n</figure>"
 
     def _render_project_from_contribution(
         self,
@@ -503,23 +857,24 @@ class JinjaSiteRenderer:
                 )
 
         # Project index
-        content = ""
+        parts = []
         if contrib.hero_figure:
-            content += self._figure_to_html(contrib.hero_figure)
+            parts.append(self._figure_to_html(contrib.hero_figure))
 
         if contrib.overview_md:
-            content += _md_to_html(contrib.overview_md)
+            parts.append(self._md_html(contrib.overview_md))
 
         if sections:
-            content += '<ul class="section-list">'
+            parts.append('<ul class="section-list">')
             for section in sections:
-                content += (
+                parts.append(
                     f'<li><a href="{section.slug}/index.html">{section.label}</a>'
                     f'<span class="desc">{section.description}</span></li>'
                 )
-            content += "</ul>"
+            parts.append("</ul>")
+        content = "".join(parts)
 
-        _render_page(
+        self._render_page(
             env,
             "base.html",
             site_dir / "index.html",
@@ -532,7 +887,8 @@ class JinjaSiteRenderer:
             toc=None,
             content=Markup(content),
         )
-        print("    index.html")
+        self._log("    index.html")
+        self._flush_log()
 
     def _render_section_pages(
         self,
@@ -546,20 +902,20 @@ class JinjaSiteRenderer:
     ) -> None:
         """Render a section with flat pages (e.g. Analysis)."""
         section_dir = Path(site_dir) / section.slug
-        section_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(section_dir)
+        section_nav = _build_project_nav(section.slug, 1, sections)
+        section_crumb = project_breadcrumb(section.label, 1)
 
-        def section_toc(active_slug=None):
-            return [
-                {
-                    "label": p.title,
-                    "url": f"{p.slug}.html",
-                    "active": p.slug == active_slug,
-                }
+        section_toc = _toc_builder(
+            [
+                {"label": p.title, "url": f"{p.slug}.html", "active": False}
                 for p in section.pages
-            ]
+            ],
+            [p.slug for p in section.pages],
+        )
 
         # Section index
-        _render_page(
+        self._render_page(
             env,
             "base.html",
             section_dir / "index.html",
@@ -567,27 +923,26 @@ class JinjaSiteRenderer:
             org_name=org_name,
             heading=section.label,
             css_path="../../style.css",
-            breadcrumb=project_breadcrumb(section.label, 1),
-            nav=_build_project_nav(section.slug, 1, sections),
+            breadcrumb=section_crumb,
+            nav=section_nav,
             toc=section_toc(),
             content=Markup(""),
         )
-        print(f"    {section.slug}/index.html")
+        self._log(f"    {section.slug}/index.html")
 
         shared = dict(
             org_name=org_name,
             css_path="../../style.css",
-            breadcrumb=project_breadcrumb(section.label, 1),
-            nav=_build_project_nav(section.slug, 1, sections),
+            breadcrumb=section_crumb,
+            nav=section_nav,
         )
 
         for page in section.pages:
-            content = ""
-            for fig in page.figures:
-                content += self._figure_to_html(fig)
-            content += _md_to_html(page.body_md)
+            parts = [self._figure_to_html(fig) for fig in page.figures]
+            parts.append(self._md_html(page.body_md))
+            content = "".join(parts)
 
-            _render_page(
+            self._render_page(
                 env,
                 "base.html",
                 section_dir / f"{page.slug}.html",
@@ -597,7 +952,8 @@ class JinjaSiteRenderer:
                 content=Markup(content),
                 **shared,
             )
-            print(f"    {section.slug}/{page.slug}.html")
+            self._log(f"    {section.slug}/{page.slug}.html")
+        self._flush_log()
 
     def _render_section_narratives(
         self,
@@ -611,7 +967,9 @@ class JinjaSiteRenderer:
     ) -> None:
         """Render a section with narrative pages."""
         section_dir = Path(site_dir) / section.slug
-        section_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(section_dir)
+        section_nav = _build_project_nav(section.slug, 1, sections)
+        section_crumb = project_breadcrumb(section.label, 1)
 
         narrative_infos = [
             {
@@ -623,18 +981,16 @@ class JinjaSiteRenderer:
             for t in section.narratives
         ]
 
-        def narratives_toc(active_name=None):
-            return [
-                {
-                    "label": t["title"],
-                    "url": t["url"],
-                    "active": t["name"] == active_name,
-                }
+        narratives_toc = _toc_builder(
+            [
+                {"label": t["title"], "url": t["url"], "active": False}
                 for t in narrative_infos
-            ]
+            ],
+            [t["name"] for t in narrative_infos],
+        )
 
         # Section index
-        _render_page(
+        self._render_page(
             env,
             "presentations_index.html",
             section_dir / "index.html",
@@ -642,12 +998,12 @@ class JinjaSiteRenderer:
             org_name=org_name,
             heading=section.label,
             css_path="../../style.css",
-            breadcrumb=project_breadcrumb(section.label, 1),
-            nav=_build_project_nav(section.slug, 1, sections),
+            breadcrumb=section_crumb,
+            nav=section_nav,
             toc=None,
             tours=narrative_infos,
         )
-        print(f"    {section.slug}/index.html")
+        self._log(f"    {section.slug}/index.html")
 
         for narrative in section.narratives:
             self._render_narrative_page(
@@ -656,10 +1012,11 @@ class JinjaSiteRenderer:
                 section_dir / f"{narrative.slug}.html",
                 org_name,
                 project_name,
-                _build_project_nav(section.slug, 1, sections),
-                project_breadcrumb(section.label, 1),
+                section_nav,
+                section_crumb,
                 narratives_toc(narrative.slug),
             )
+        self._flush_log()
 
     def _render_narrative_page(
         self,
@@ -673,19 +1030,15 @@ class JinjaSiteRenderer:
         toc,
     ) -> None:
         """Render a single narrative page."""
-        opening_html = _md_to_html(narrative.opening_md) if narrative.opening_md else ""
+        opening_html = self._md_html(narrative.opening_md)
 
         template_groups = []
         for group in narrative.groups:
             rendered_rows = []
             for stop in group.stops:
-                svgs_html = ""
-                for fig in stop.figures:
-                    svgs_html += self._figure_to_html(fig)
+                svgs_html = "".join(self._figure_to_html(fig) for fig in stop.figures)
 
-                analysis_html = ""
-                if stop.analysis_md:
-                    analysis_html = _md_to_html(stop.analysis_md)
+                analysis_html = self._md_html(stop.analysis_md)
 
                 rendered_rows.append(
                     {
@@ -697,9 +1050,7 @@ class JinjaSiteRenderer:
                     }
                 )
 
-            transition_html = ""
-            if group.transition_md:
-                transition_html = _md_to_html(group.transition_md)
+            transition_html = self._md_html(group.transition_md)
 
             template_groups.append(
                 {
@@ -708,7 +1059,7 @@ class JinjaSiteRenderer:
                 }
             )
 
-        _render_page(
+        self._render_page(
             env,
             "narrative.html",
             output_file,
@@ -722,7 +1073,7 @@ class JinjaSiteRenderer:
             opening_html=Markup(opening_html),
             groups=template_groups,
         )
-        print(f"    {Path(output_file).parent.name}/{narrative.slug}.html")
+        self._log(f"    {Path(output_file).parent.name}/{narrative.slug}.html")
 
     def _render_section_groups(
         self,
@@ -736,7 +1087,9 @@ class JinjaSiteRenderer:
     ) -> None:
         """Render a section with categorized groups."""
         section_dir = Path(site_dir) / section.slug
-        section_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(section_dir)
+        section_nav = _build_project_nav(section.slug, 1, sections)
+        section_crumb = project_breadcrumb(section.label, 1)
 
         # Flatten all pages for TOC
         all_pages = [p for g in section.groups for p in g.pages]
@@ -750,18 +1103,16 @@ class JinjaSiteRenderer:
             for g in section.groups
         ]
 
-        def groups_toc(active_slug=None):
-            return [
-                {
-                    "label": p.title,
-                    "url": f"{p.slug}.html",
-                    "active": p.slug == active_slug,
-                }
+        groups_toc = _toc_builder(
+            [
+                {"label": p.title, "url": f"{p.slug}.html", "active": False}
                 for p in all_pages
-            ]
+            ],
+            [p.slug for p in all_pages],
+        )
 
         # Groups index
-        _render_page(
+        self._render_page(
             env,
             "groups_index.html",
             section_dir / "index.html",
@@ -769,27 +1120,26 @@ class JinjaSiteRenderer:
             org_name=org_name,
             heading=section.label,
             css_path="../../style.css",
-            breadcrumb=project_breadcrumb(section.label, 1),
-            nav=_build_project_nav(section.slug, 1, sections),
+            breadcrumb=section_crumb,
+            nav=section_nav,
             toc=None,
             categories=categories,
         )
-        print(f"    {section.slug}/index.html")
+        self._log(f"    {section.slug}/index.html")
 
         shared = dict(
             org_name=org_name,
             css_path="../../style.css",
-            breadcrumb=project_breadcrumb(section.label, 1),
-            nav=_build_project_nav(section.slug, 1, sections),
+            breadcrumb=section_crumb,
+            nav=section_nav,
         )
 
         for page in all_pages:
-            content = ""
-            for fig in page.figures:
-                content += self._figure_to_html(fig)
-            content += _md_to_html(page.body_md)
+            parts = [self._figure_to_html(fig) for fig in page.figures]
+            parts.append(self._md_html(page.body_md))
+            content = "".join(parts)
 
-            _render_page(
+            self._render_page(
                 env,
                 "base.html",
                 section_dir / f"{page.slug}.html",
@@ -799,4 +1149,5 @@ class JinjaSiteRenderer:
                 content=Markup(content),
                 **shared,
             )
-            print(f"    {section.slug}/{page.slug}.html")
+            self._log(f"    {section.slug}/{page.slug}.html")
+        self._flush_log()
@@ -19,13 +19,52 @@ only for hatch build/editable-install.
 from __future__ import annotations
 
 import importlib
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from types import ModuleType
 
 from practice.entities import Pipeline
 
 
+def _subdirs(parent: Path) -> list[Path]:
+    """Return sorted subdirectories of *parent* from a single scandir pass.
+
+    Returns an empty list when *parent* does not exist.
+    """
+    try:
+        with os.scandir(parent) as it:
+            names = sorted(e.name for e in it if e.is_dir())
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    return [parent / name for name in names]
+
+
+def commons_repo_dirs(repo_root: Path) -> list[Path]:
+    """Return ``commons/{org}/{repo}/`` directories, skipping dot-orgs."""
+    dirs: list[Path] = []
+    for org in _subdirs(repo_root / "commons"):
+        if org.name.startswith("."):
+            continue
+        dirs.extend(_subdirs(org))
+    return dirs
+
+
+def _commons_skillsets_dirs(repo_root: Path) -> list[Path]:
+    """Return ``commons/{org}/{repo}/skillsets/`` directories that exist."""
+    return [
+        repo / "skillsets"
+        for repo in commons_repo_dirs(repo_root)
+        if os.path.isdir(repo / "skillsets")
+    ]
+
+
+def partnership_dirs(repo_root: Path) -> list[Path]:
+    """Return ``partnerships/{slug}/`` directories, sorted by slug."""
+    return _subdirs(repo_root / "partnerships")
+
+
 def bc_package_dirs(repo_root: Path) -> list[Path]:
     """Return directories that contain BC packages.
 
@@ -37,80 +76,102 @@ def bc_package_dirs(repo_root: Path) -> list[Path]:
     - ``personal/skillsets/`` (if present)
     - ``partnerships/{slug}/skillsets/`` (if present)
     """
-    dirs: list[Path] = []
-
-    # Commons: commons/{org}/{repo}/skillsets/
-    commons = repo_root / "commons"
-    if commons.is_dir():
-        for org in sorted(commons.iterdir()):
-            if not org.is_dir() or org.name.startswith("."):
-                continue
-            for repo in sorted(org.iterdir()):
-                if not repo.is_dir():
-                    continue
-                skillsets_dir = repo / "skillsets"
-                if skillsets_dir.is_dir():
-                    dirs.append(skillsets_dir)
+    dirs = _commons_skillsets_dirs(repo_root)
 
     # Personal: personal/skillsets/
     personal_ss = repo_root / "personal" / "skillsets"
-    if personal_ss.is_dir():
+    if os.path.isdir(personal_ss):
         dirs.append(personal_ss)
 
     # Partnerships: partnerships/{slug}/skillsets/
-    partnerships = repo_root / "partnerships"
-    if partnerships.is_dir():
-        for child in sorted(partnerships.iterdir()):
-            if not child.is_dir():
-                continue
-            ss = child / "skillsets"
-            if ss.is_dir():
-                dirs.append(ss)
+    for child in partnership_dirs(repo_root):
+        ss = child / "skillsets"
+        if os.path.isdir(ss):
+            dirs.append(ss)
 
     return dirs
 
 
-def skill_search_dirs(repo_root: Path) -> list[Path]:
-    """Return directories to scan for SKILL.md files.
+def _mtime_ns(path: Path) -> int:
+    """Return *path*'s mtime in nanoseconds, or -1 when it is missing."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
 
-    - ``{repo_root}/skills/`` (repo-root generic skills)
-    - ``personal/`` (full recursive scan)
-    - ``partnerships/{slug}/`` (full recursive scan)
-    - ``commons/{org}/{repo}/skillsets/`` (only skillset-owned skills)
+
+# repo root -> (directories read, their mtimes, resulting search dirs)
+_skill_search_cache: dict[
+    str, tuple[tuple[Path, ...], tuple[int, ...], tuple[Path, ...]]
+] = {}
+
+
+def _scan_skill_search_dirs(
+    repo_root: Path,
+) -> tuple[tuple[Path, ...], tuple[int, ...], tuple[Path, ...]]:
+    """List skill search directories, recording every directory read.
+
+    Each directory's mtime is taken before its entries are read, so a
+    change made during the scan invalidates the result.
     """
+    watched: list[Path] = []
+    mtimes: list[int] = []
+
+    def watch(path: Path) -> None:
+        watched.append(path)
+        mtimes.append(_mtime_ns(path))
+
+    watch(repo_root)
+    watch(repo_root / "partnerships")
+    watch(repo_root / "commons")
     dirs: list[Path] = []
 
     # Repo-root generic skills
     root_skills = repo_root / "skills"
-    if root_skills.is_dir():
+    if os.path.isdir(root_skills):
         dirs.append(root_skills)
 
     # Personal — full scan (skills/ and skillsets/)
     personal = repo_root / "personal"
-    if personal.is_dir():
+    if os.path.isdir(personal):
         dirs.append(personal)
 
     # Partnerships — full scan per slug
-    partnerships = repo_root / "partnerships"
-    if partnerships.is_dir():
-        for child in sorted(partnerships.iterdir()):
-            if child.is_dir():
-                dirs.append(child)
+    dirs.extend(partnership_dirs(repo_root))
 
     # Commons — only skillset-owned skills (not top-level skills/)
-    commons = repo_root / "commons"
-    if commons.is_dir():
-        for org in sorted(commons.iterdir()):
-            if not org.is_dir() or org.name.startswith("."):
-                continue
-            for repo in sorted(org.iterdir()):
-                if not repo.is_dir():
-                    continue
-                skillsets_dir = repo / "skillsets"
-                if skillsets_dir.is_dir():
-                    dirs.append(skillsets_dir)
+    for org in _subdirs(repo_root / "commons"):
+        if org.name.startswith("."):
+            continue
+        watch(org)
+        for repo in _subdirs(org):
+            watch(repo)
+            if os.path.isdir(repo / "skillsets"):
+                dirs.append(repo / "skillsets")
 
-    return dirs
+    return tuple(watched), tuple(mtimes), tuple(dirs)
+
+
+def skill_search_dirs(repo_root: Path) -> list[Path]:
+    """Return directories to scan for SKILL.md files.
+
+    - ``{repo_root}/skills/`` (repo-root generic skills)
+    - ``personal/`` (full recursive scan)
+    - ``partnerships/{slug}/`` (full recursive scan)
+    - ``commons/{org}/{repo}/skillsets/`` (only skillset-owned skills)
+
+    Results are memoised per repo root and revalidated against the
+    mtimes of every directory the listing read, so a repeat call costs
+    one stat per directory instead of a scan.
+    """
+    key = str(repo_root)
+    cached = _skill_search_cache.get(key)
+    if cached is not None:
+        watched, mtimes, dirs = cached
+        if tuple(_mtime_ns(path) for path in watched) == mtimes:
+            return list(dirs)
+    cached = _skill_search_cache[key] = _scan_skill_search_dirs(repo_root)
+    return list(cached[2])
 
 
 def source_container_dirs(repo_root: Path) -> list[Path]:
@@ -122,22 +183,56 @@ def source_container_dirs(repo_root: Path) -> list[Path]:
     dirs: list[Path] = []
 
     commons = repo_root / "commons"
-    if commons.is_dir():
+    if os.path.isdir(commons):
         dirs.append(commons)
 
     personal = repo_root / "personal"
-    if personal.is_dir():
+    if os.path.isdir(personal):
         dirs.append(personal)
 
-    partnerships = repo_root / "partnerships"
-    if partnerships.is_dir():
-        for child in sorted(partnerships.iterdir()):
-            if child.is_dir():
-                dirs.append(child)
+    dirs.extend(partnership_dirs(repo_root))
 
     return dirs
 
 
+def find_named(root: Path, name: str) -> list[Path]:
+    """Return every file called *name* under *root*, sorted.
+
+    Equivalent to ``sorted(root.rglob(name))`` for a literal file name,
+    but walks with ``os.scandir`` so directory tests use the cached
+    entry type and no Path is built for entries that do not match.
+    Symlinked directories are not descended into, as with ``rglob``.
+    """
+    found: list[Path] = []
+    stack = [str(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name == name and entry.is_file():
+                    found.append(Path(entry.path))
+    found.sort()
+    return found
+
+
+def find_named_in(roots: list[Path], name: str) -> list[list[Path]]:
+    """Run :func:`find_named` over several roots concurrently.
+
+    Directory walking is syscall-bound, so the roots are scanned on a
+    small thread pool. Returns one sorted match list per root, in the
+    order the roots were given.
+    """
+    if len(roots) < 2:
+        return [find_named(root, name) for root in roots]
+    with ThreadPoolExecutor(max_workers=min(8, len(roots))) as pool:
+        return list(pool.map(lambda root: find_named(root, name), roots))
+
+
 def ensure_on_sys_path(directory: Path) -> None:
     """Add *directory* to ``sys.path`` if not already present."""
     path_str = str(directory)
@@ -155,6 +250,64 @@ def _get_pipelines(mod: ModuleType) -> list[Pipeline]:
     return getattr(mod, "PIPELINES", getattr(mod, "SKILLSETS", []))
 
 
+def _get_module(name: str) -> ModuleType:
+    """Return module *name*, consulting ``sys.modules`` before importing."""
+    mod = sys.modules.get(name)
+    if mod is not None:
+        return mod
+    return importlib.import_module(name)
+
+
+def _bc_candidates(source_dir: Path) -> list[str]:
+    """Return sorted names of subdirectories of *source_dir* with ``__init__.py``."""
+    names: list[str] = []
+    with os.scandir(source_dir) as it:
+        for entry in it:
+            if entry.is_dir() and os.path.isfile(
+                os.path.join(entry.path, "__init__.py")
+            ):
+                names.append(entry.name)
+    names.sort()
+    return names
+
+
+def _import_bc_groups(source_dirs: list[Path]) -> list[list[ModuleType]]:
+    """Import BC packages from every directory in *source_dirs* in one pass.
+
+    Candidates are listed up front, then all source directories are put
+    on ``sys.path`` together (earlier directories take precedence) before
+    any import runs, so the path is mutated once per batch rather than
+    once per directory. Returns one module list per input directory, in
+    input order; missing directories yield an empty list.
+    """
+    batch = [(d, _bc_candidates(d) if d.is_dir() else []) for d in source_dirs]
+
+    missing = [
+        path_str
+        for path_str in dict.fromkeys(str(d) for d, names in batch if names)
+        if path_str not in sys.path
+    ]
+    sys.path[0:0] = missing
+
+    groups: list[list[ModuleType]] = []
+    for _, names in batch:
+        modules: list[ModuleType] = []
+        for name in names:
+            try:
+                mod = _get_module(name)
+            except ImportError:
+                continue
+            if _has_pipelines(mod):
+                modules.append(mod)
+        groups.append(modules)
+    return groups
+
+
+def _import_bc_packages(source_dirs: list[Path]) -> list[ModuleType]:
+    """Import BC packages from *source_dirs* and return them as one list."""
+    return [mod for group in _import_bc_groups(source_dirs) for mod in group]
+
+
 def scan_bc_packages(source_dir: Path) -> list[ModuleType]:
     """Import BC packages from *source_dir* and return those with PIPELINES.
 
@@ -162,30 +315,12 @@ def scan_bc_packages(source_dir: Path) -> list[ModuleType]:
     subdirectory containing ``__init__.py`` that exports ``PIPELINES``
     (or the legacy ``SKILLSETS`` attribute).
     """
-    if not source_dir.is_dir():
-        return []
-
-    ensure_on_sys_path(source_dir)
-
-    modules: list[ModuleType] = []
-    for child in sorted(source_dir.iterdir()):
-        if not child.is_dir() or not (child / "__init__.py").is_file():
-            continue
-        try:
-            mod = importlib.import_module(child.name)
-            if _has_pipelines(mod):
-                modules.append(mod)
-        except ImportError:
-            continue
-    return modules
+    return _import_bc_packages([source_dir])
 
 
 def discover_all_bc_modules(repo_root: Path) -> list[ModuleType]:
     """Scan all BC package directories and return every BC module."""
-    modules: list[ModuleType] = []
-    for pkg_dir in bc_package_dirs(repo_root):
-        modules.extend(scan_bc_packages(pkg_dir))
-    return modules
+    return _import_bc_packages(bc_package_dirs(repo_root))
 
 
 def collect_pipelines(source_dir: Path) -> list[Pipeline]:
@@ -196,5 +331,29 @@ def collect_pipelines(source_dir: Path) -> list[Pipeline]:
     return result
 
 
+def collect_pipelines_by_dir(source_dirs: list[Path]) -> list[list[Pipeline]]:
+    """Scan several source directories in one batch, grouping pipelines.
+
+    Returns one pipeline list per entry in *source_dirs*, in order.
+    """
+    return [
+        [p for mod in group for p in _get_pipelines(mod)]
+        for group in _import_bc_groups(source_dirs)
+    ]
+
+
+def collect_all_pipelines(repo_root: Path) -> list[Pipeline]:
+    """Return the pipelines of every BC package under *repo_root*.
+
+    Directories are scanned in :func:`bc_package_dirs` order, so a
+    pipeline declared in more than one place appears once per place.
+    """
+    return [
+        p
+        for group in collect_pipelines_by_dir(bc_package_dirs(repo_root))
+        for p in group
+    ]
+
+
 # Backwards-compatible alias
 collect_skillsets = collect_pipelines
@@ -3,10 +3,15 @@
 Extracts YAML frontmatter from ``---``-delimited markdown files using
 ``yaml.safe_load``.  Returns a ``dict[str, Any]`` preserving nested
 structures (lists, dicts) that the flat parser previously lost.
+
+``parse_frontmatter_cached`` memoizes parses per process on the file's
+(path, mtime_ns, size) for manifests that are read repeatedly.
 """
 
 from __future__ import annotations
 
+import functools
+import os
 from pathlib import Path
 from typing import Any
 
@@ -19,20 +24,48 @@ def parse_frontmatter(path: Path) -> dict[str, Any]:
     Returns an empty dict when the file has no ``---`` delimiters,
     only a single delimiter (incomplete frontmatter), or malformed YAML.
     """
-    text = path.read_text()
+    return parse_frontmatter_with_body(path)[0]
+
+
+def parse_frontmatter_with_body(path: Path) -> tuple[dict[str, Any], str]:
+    """Read *path* once and return ``(metadata, body)``.
+
+    *metadata* follows the same rules as :func:`parse_frontmatter`.
+    *body* is everything after the closing ``---``, unstripped, or the
+    whole text when there is no complete frontmatter block.
+    """
+    return parse_frontmatter_text(path.read_text())
+
+
+def parse_frontmatter_text(text: str) -> tuple[dict[str, Any], str]:
+    """Like :func:`parse_frontmatter_with_body`, for text already in hand."""
     parts = text.split("---", 2)
     if len(parts) < 3:
-        return {}
+        return {}, text
 
     try:
         parsed = yaml.safe_load(parts[1])
     except yaml.YAMLError:
-        return {}
+        return {}, parts[2]
 
     if not isinstance(parsed, dict):
-        return {}
+        return {}, parts[2]
+
+    return parsed, parts[2]
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_frontmatter_at(path_str: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    return parse_frontmatter(Path(path_str))
 
-    return parsed
+
+def parse_frontmatter_cached(path: Path) -> dict[str, Any]:
+    """Like :func:`parse_frontmatter`, memoized on the file's stat signature.
+
+    Returns a shallow copy so callers cannot mutate the cached entry.
+    """
+    st = os.stat(path)
+    return dict(_parse_frontmatter_at(str(path), st.st_mtime_ns, st.st_size))
 
 
 def split_frontmatter(text: str) -> tuple[dict[str, str], str]:
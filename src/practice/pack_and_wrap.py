@@ -12,7 +12,7 @@ from pathlib import Path
 from pydantic import BaseModel
 
 from practice.content_hash import hash_children, hash_content
-from practice.entities import CompilationState
+from practice.entities import CompilationState, PackFreshness
 from practice.frontmatter import format_frontmatter
 from practice.repositories import FreshnessInspector, ItemCompiler
 
@@ -40,15 +40,47 @@ def pack_and_wrap(
 
     compiled_items: list[str] = []
     deleted_orphans: list[str] = []
+    _compile_pack(pack_root, freshness, compiler, deep, compiled_items, deleted_orphans)
 
+    # --- Re-assess for final state ---
+    final_freshness = inspector.assess(pack_root)
+    state_after = (
+        final_freshness.deep_state if deep else final_freshness.compilation_state
+    )
+
+    return PackAndWrapResult(
+        compiled_items=compiled_items,
+        deleted_orphans=deleted_orphans,
+        state_before=state_before,
+        state_after=state_after,
+    )
+
+
+def _compile_pack(
+    pack_root: Path,
+    freshness: PackFreshness,
+    compiler: ItemCompiler,
+    deep: bool,
+    compiled_items: list[str],
+    deleted_orphans: list[str],
+) -> None:
+    """Compile one pack level from an existing assessment.
+
+    Child packs are compiled from the subtree already assessed by the
+    caller rather than being assessed a second time.
+    """
     # --- Deep: recursively compile children bottom-up ---
     if deep:
         for child in freshness.children:
-            child_root = Path(child.pack_root)
             if child.deep_state != CompilationState.CLEAN:
-                child_result = pack_and_wrap(child_root, inspector, compiler, deep=True)
-                compiled_items.extend(child_result.compiled_items)
-                deleted_orphans.extend(child_result.deleted_orphans)
+                _compile_pack(
+                    Path(child.pack_root),
+                    child,
+                    compiler,
+                    True,
+                    compiled_items,
+                    deleted_orphans,
+                )
 
     bytecode_dir = pack_root / "_bytecode"
 
@@ -81,16 +113,3 @@ def pack_and_wrap(
             mirror = bytecode_dir / f"{item.name}.md"
             mirror.write_text(format_frontmatter({"source_hash": source_hash}, summary))
             compiled_items.append(item.name)
-
-    # --- Re-assess for final state ---
-    final_freshness = inspector.assess(pack_root)
-    state_after = (
-        final_freshness.deep_state if deep else final_freshness.compilation_state
-    )
-
-    return PackAndWrapResult(
-        compiled_items=compiled_items,
-        deleted_orphans=deleted_orphans,
-        state_before=state_before,
-        state_after=state_after,
-    )
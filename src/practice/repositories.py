@@ -2,10 +2,16 @@
 
 These protocols define the ports that the practice layer requires.
 Implementations are injected by the application layer.
+
+Read-only reference-data repositories return ``Sequence`` from
+``list_all()``. Implementations hand back their immutable backing
+tuple rather than a defensive copy; callers that need to mutate the
+result take their own ``list(...)``.
 """
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from datetime import date, datetime, tzinfo
 from pathlib import Path
 from typing import Protocol, runtime_checkable
@@ -87,7 +93,7 @@ class SourceRepository(Protocol):
         """Retrieve a source by slug."""
         ...
 
-    def list_all(self) -> list[SkillsetSource]:
+    def list_all(self) -> Sequence[SkillsetSource]:
         """List all installed sources."""
         ...
 
@@ -124,7 +130,7 @@ class ProfileRepository(Protocol):
         """Retrieve a profile by name, returning (profile, source_slug) or None."""
         ...
 
-    def list_all(self) -> list[tuple[Profile, str]]:
+    def list_all(self) -> Sequence[tuple[Profile, str]]:
         """List all profiles as (profile, source_slug) tuples."""
         ...
 
@@ -250,7 +256,7 @@ class SkillManifestRepository(Protocol):
         """Retrieve a skill manifest by name."""
         ...
 
-    def list_all(self) -> list[SkillManifest]:
+    def list_all(self) -> Sequence[SkillManifest]:
         """List all discovered skill manifests."""
         ...
 
@@ -273,7 +279,7 @@ class SkillsetRepository(Protocol):
         """Retrieve a pipeline by name."""
         ...
 
-    def list_all(self) -> list[Pipeline]:
+    def list_all(self) -> Sequence[Pipeline]:
         """List all known pipelines."""
         ...
 
@@ -286,11 +292,11 @@ class KnowledgePackRepository(Protocol):
         """Retrieve a knowledge pack by name."""
         ...
 
-    def list_all(self) -> list[KnowledgePack]:
+    def list_all(self) -> Sequence[KnowledgePack]:
         """List all discovered knowledge packs."""
         ...
 
-    def packs_with_paths(self) -> list[tuple[KnowledgePack, Path]]:
+    def packs_with_paths(self) -> Sequence[tuple[KnowledgePack, Path]]:
         """Return (pack, pack_root) pairs for all discovered packs."""
         ...
 
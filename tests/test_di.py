@@ -8,11 +8,14 @@ usecase and CLI test suites.
 
 from __future__ import annotations
 
+import os
+import tempfile
 from pathlib import Path
 
 import pytest
 
 from bin.cli.config import Config
+from bin.cli.di import Container
 
 
 class TestConfig:
@@ -46,3 +49,18 @@ class TestContainerWiring:
         """BC discovery populates the nudger's skillset-to-directory mapping."""
         # At least one BC module has SKILLSETS → mapping should be non-empty
         assert container.pack_nudger._skillset_bc_dirs
+
+
+class TestContainerConstruction:
+    """Building the container touches no optional cache directories."""
+
+    def test_unusable_tmpdir(self, tmp_config, tmp_path, monkeypatch):
+        """A TMPDIR Jinja would reject does not stop the container."""
+        bad_tmp = tmp_path / "tmp"
+        bad_tmp.mkdir()
+        (bad_tmp / f"_jinja2-cache-{os.getuid()}").write_text("not a directory")
+        monkeypatch.setenv("TMPDIR", str(bad_tmp))
+        monkeypatch.setattr(tempfile, "tempdir", None)
+
+        container = Container(tmp_config)
+        assert container.site_renderer is not None
@@ -127,6 +127,32 @@ class TestFreshnessDetection:
         result = FilesystemFreshnessInspector().assess(root)
         assert result.compilation_state == CompilationState.CLEAN
 
+    def test_reassess_after_edit_is_dirty(self, tmp_path):
+        """Editing a source between assessments is seen despite hash caching."""
+        root = write_pack(
+            tmp_path,
+            "pack",
+            {"alpha": "A"},
+            bytecode={"alpha": "sA"},
+        )
+        inspector = FilesystemFreshnessInspector()
+        assert inspector.assess(root).compilation_state == CompilationState.CLEAN
+
+        (root / "alpha.md").write_text("A modified")
+
+        assert inspector.assess(root).compilation_state == CompilationState.DIRTY
+
+    def test_large_mirror_body_is_clean(self, tmp_path):
+        """Mirror body far larger than the frontmatter head → still CLEAN."""
+        root = write_pack(
+            tmp_path,
+            "pack",
+            {"alpha": "A"},
+            bytecode={"alpha": "x" * 20_000},
+        )
+        result = FilesystemFreshnessInspector().assess(root)
+        assert result.compilation_state == CompilationState.CLEAN
+
     def test_mixed_dirty_and_orphan_is_corrupt(self, tmp_path):
         """Both stale items AND orphan mirrors → CORRUPT."""
         root = write_pack(
@@ -6,6 +6,8 @@ aggregation/routing use cases that depend on it.
 
 from __future__ import annotations
 
+import os
+
 import pytest
 
 from bin.cli.di import Container
@@ -14,6 +16,9 @@ from bin.cli.dtos import (
     CreateEngagementRequest,
     InitializeWorkspaceRequest,
 )
+from bin.cli.infrastructure.filesystem_observation_writer import (
+    FilesystemObservationWriter,
+)
 from bin.cli.usecases import AggregateNeedsBriefUseCase
 from practice.entities import SourceType
 from practice.exceptions import NotFoundError
@@ -22,7 +27,9 @@ from .conftest import (
     DEFAULT_CLIENT,
     DEFAULT_ENGAGEMENT,
     make_engagement_entity,
+    make_observation,
     make_project,
+    make_routing_destination,
     make_skillset_source,
 )
 
@@ -495,3 +502,26 @@ class TestFlushObservations:
             FlushObservationsRequest(client=CLIENT, engagement=ENGAGEMENT)
         )
         assert not list(pending_dir.glob("*.md"))  # Files cleared after flush
+
+
+class TestObservationFileMode:
+    """Observation files are created with the umask deciding permissions."""
+
+    def test_group_writable_umask_respected(self, tmp_path):
+        writer = FilesystemObservationWriter(
+            repo_root=tmp_path,
+            workspace_root=tmp_path / "clients",
+        )
+        obs = make_observation(
+            slug="shared-obs",
+            destinations=[
+                make_routing_destination(owner_type="client", owner_ref=CLIENT)
+            ],
+        )
+        old = os.umask(0o002)
+        try:
+            writer.write(obs)
+        finally:
+            os.umask(old)
+        path = tmp_path / "clients" / CLIENT / "observations" / "shared-obs.md"
+        assert path.stat().st_mode & 0o777 == 0o664
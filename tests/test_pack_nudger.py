@@ -25,6 +25,8 @@ Three test phases:
 
 from __future__ import annotations
 
+from pathlib import Path
+
 import pytest
 
 from bin.cli.infrastructure.filesystem_freshness_inspector import (
@@ -34,7 +36,7 @@ from bin.cli.infrastructure.filesystem_knowledge_pack_repository import (
     FilesystemKnowledgePackRepository,
 )
 from bin.cli.infrastructure.pack_nudger import FilesystemPackNudger
-from practice.frontmatter import parse_frontmatter
+from practice.frontmatter import parse_frontmatter, parse_frontmatter_cached
 
 from .conftest import write_pack
 
@@ -118,6 +120,15 @@ class TestManifestFrontmatter:
         fm = parse_frontmatter(index)
         assert fm == {}
 
+    def test_cached_parse_sees_edits(self, tmp_path):
+        """Cached parse is invalidated when the file changes."""
+        index = tmp_path / "index.md"
+        index.write_text("---\nname: before\npurpose: P.\n---\n")
+        assert parse_frontmatter_cached(index)["name"] == "before"
+
+        index.write_text("---\nname: after-edit\npurpose: P.\n---\n")
+        assert parse_frontmatter_cached(index)["name"] == "after-edit"
+
 
 # ---------------------------------------------------------------------------
 # Phase 2: Pack discovery — scanning source containers
@@ -183,6 +194,31 @@ class TestPackDiscovery:
         packs = self._discover(tmp_path)
         assert packs == []
 
+    def test_discovers_flow_style_manifest(self, tmp_path):
+        """Quoted keys in flow-style frontmatter still pass the prefilter."""
+        docs = tmp_path / "docs" / "flow"
+        docs.mkdir(parents=True)
+        (docs / "index.md").write_text(
+            '---\n{"name": flow-pack, "purpose": Flow knowledge.}\n---\n'
+        )
+        packs = self._discover(tmp_path)
+        assert packs == [("flow-pack", docs)]
+
+    def test_manifest_read_once(self, tmp_path, monkeypatch):
+        """Frontmatter is parsed from the prefiltered bytes, not re-read."""
+        docs = tmp_path / "docs" / "once"
+        docs.mkdir(parents=True)
+        (docs / "index.md").write_text(
+            "---\r\nname: once-pack\r\npurpose: Read once.\r\n---\r\n"
+        )
+
+        def _no_read_text(self, *args, **kwargs):
+            raise AssertionError(f"{self} read a second time")
+
+        monkeypatch.setattr(Path, "read_text", _no_read_text)
+        packs = self._discover(tmp_path)
+        assert packs == [("once-pack", docs)]
+
     def test_discovers_under_personal(self, tmp_path):
         """Pack in personal/ source container → discovered."""
         personal = tmp_path / "personal" / "my-pack"
@@ -203,6 +239,17 @@ class TestPackDiscovery:
         packs = self._discover(tmp_path)
         assert ("acme-pack", partner) in packs
 
+    def test_symlinked_root_walked_once(self, tmp_path):
+        """personal/ linked into commons/ → its pack is listed once."""
+        shared = tmp_path / "commons" / "org" / "shared"
+        shared.mkdir(parents=True)
+        (shared / "index.md").write_text(
+            "---\nname: shared-pack\npurpose: Shared knowledge.\n---\n"
+        )
+        (tmp_path / "personal").symlink_to(shared)
+        packs = self._discover(tmp_path)
+        assert packs == [("shared-pack", shared)]
+
     def test_skips_missing_dirs(self, tmp_path):
         """Absent personal/ and partnerships/ directories → no error."""
         (tmp_path / "docs").mkdir()
@@ -527,10 +574,10 @@ class TestKnowledgePackRepositoryProtocol:
         assert names == {"pack-a", "pack-b"}
 
     def test_list_all_empty_when_no_packs(self, tmp_path):
-        """list_all() returns empty list when no packs exist."""
+        """list_all() returns an empty sequence when no packs exist."""
         (tmp_path / "docs").mkdir()
         repo = FilesystemKnowledgePackRepository(tmp_path)
-        assert repo.list_all() == []
+        assert repo.list_all() == ()
 
     def test_get_skips_invalid_manifest(self, tmp_path):
         """Pack with invalid manifest data is invisible to get()."""
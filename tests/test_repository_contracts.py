@@ -512,6 +512,21 @@ class TestPendingObservationStoreContract:
         pending_store.clear_pending(CLIENT, ENGAGEMENT)
         assert not list(pending_dir.glob("*.md"))
 
+    def test_clear_pending_removes_dangling_links(self, pending_store, tmp_path):
+        pending_dir = (
+            tmp_path
+            / "clients"
+            / CLIENT
+            / "engagements"
+            / ENGAGEMENT
+            / ".observations-pending"
+        )
+        pending_dir.mkdir(parents=True)
+        dangling = pending_dir / "gone.md"
+        dangling.symlink_to(tmp_path / "missing.md")
+        pending_store.clear_pending(CLIENT, ENGAGEMENT)
+        assert not dangling.is_symlink()
+
     def test_nonexistent_dir_returns_empty(self, pending_store):
         result = pending_store.read_pending("no-such-client", "no-such-engagement")
         assert result == []
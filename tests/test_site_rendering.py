@@ -15,12 +15,23 @@ from bin.cli.config import Config
 from bin.cli.di import Container
 from .conftest import _HAS_BC_PACKAGES
 from bin.cli.dtos import RenderSiteRequest
+from bin.cli.infrastructure import jinja_renderer
 from bin.cli.infrastructure.code_skillset_repository import CodeSkillsetRepository
+from bin.cli.infrastructure.jinja_renderer import JinjaSiteRenderer
 from bin.cli.dtos import (
     CreateEngagementRequest,
     InitializeWorkspaceRequest,
     RegisterProjectRequest,
 )
+from practice.content import (
+    ContentPage,
+    Figure,
+    NarrativeGroup,
+    NarrativePage,
+    NarrativeStop,
+    ProjectContribution,
+    ProjectSection,
+)
 
 CLIENT = "acme-corp"
 
@@ -131,3 +142,218 @@ class TestPageCount:
         pages = list(rendered_site.rglob("*.html"))
         # Client: 4 + Research: 2 + at least 1 project index per BC
         assert len(pages) >= 8, f"Only {len(pages)} pages rendered"
+
+
+# ---------------------------------------------------------------------------
+# Renderer-level tests (no BC packages needed)
+# ---------------------------------------------------------------------------
+
+_FIGURE = Figure(caption="Map", svg_content='<svg width="10"><rect/></svg>')
+
+
+def _contributions(count: int) -> list[ProjectContribution]:
+    pages = [
+        ContentPage(
+            title=f"Page {i}",
+            slug=f"page-{i}",
+            body_md=f"# Page {i}\n\nBody of page {i}.",
+            figures=[_FIGURE],
+        )
+        for i in range(3)
+    ]
+    tour = NarrativePage(
+        title="Tour",
+        slug="tour",
+        description="A tour.",
+        opening_md="Opening prose.",
+        groups=[
+            NarrativeGroup(
+                stops=[
+                    NarrativeStop(
+                        title="Stop",
+                        level="1",
+                        is_header=False,
+                        figures=[_FIGURE],
+                        analysis_md="Stop analysis.",
+                    )
+                ],
+                transition_md="Onwards.",
+            )
+        ],
+    )
+    return [
+        ProjectContribution(
+            slug=f"proj-{n}",
+            title=f"Project {n}",
+            skillset="test",
+            status="complete",
+            overview_md=f"Overview of project {n}.",
+            sections=[
+                ProjectSection(label="Analysis", slug="analysis", pages=pages),
+                ProjectSection(label="Tours", slug="tours", narratives=[tour]),
+            ],
+        )
+        for n in range(count)
+    ]
+
+
+def _render(workspace_root: Path, contributions) -> dict[str, bytes]:
+    """Render CLIENT's site and return its files keyed by relative path."""
+    ws = workspace_root / CLIENT
+    _write(ws / "engagement.md", "# Engagement — Acme Corp\n\nScope.")
+    _build_research(ws)
+    renderer = JinjaSiteRenderer(workspace_root, _REPO_ROOT)
+    site = renderer.render(CLIENT, contributions, [])
+    return {
+        p.relative_to(site).as_posix(): p.read_bytes()
+        for p in sorted(site.rglob("*"))
+        if p.is_file()
+    }
+
+
+@pytest.fixture
+def pool_starts(monkeypatch):
+    """Record the worker counts of process pools the renderer starts."""
+    starts: list[int] = []
+
+    class _RecordingPool(jinja_renderer.ProcessPoolExecutor):
+        def __init__(self, max_workers=None, **kwargs):
+            starts.append(max_workers)
+            super().__init__(max_workers=max_workers, **kwargs)
+
+    monkeypatch.setattr(jinja_renderer, "ProcessPoolExecutor", _RecordingPool)
+    return starts
+
+
+class TestParallelRendering:
+    """Projects rendered in the process pool match a serial render."""
+
+    def test_pool_output_matches_serial(self, tmp_path, monkeypatch, pool_starts):
+        contributions = _contributions(3)
+
+        monkeypatch.setattr(jinja_renderer, "usable_cpu_count", lambda: 1)
+        serial = _render(tmp_path / "serial", contributions)
+
+        monkeypatch.setattr(jinja_renderer, "usable_cpu_count", lambda: 4)
+        monkeypatch.setattr(jinja_renderer, "_worth_pooling", lambda *args: True)
+        parallel = _render(tmp_path / "parallel", contributions)
+
+        assert pool_starts == [3]
+        assert "proj-2/tours/tour.html" in serial
+        assert parallel == serial
+        # Entries used only by workers survive the end-of-render prune.
+        serial_cache = tmp_path / "serial" / ".md-cache" / CLIENT
+        parallel_cache = tmp_path / "parallel" / ".md-cache" / CLIENT
+        assert sorted(p.name for p in parallel_cache.iterdir()) == sorted(
+            p.name for p in serial_cache.iterdir()
+        )
+
+    def test_second_render_in_pool_matches_first(
+        self, tmp_path, monkeypatch, pool_starts
+    ):
+        """Workers reused across renders start each render afresh."""
+        monkeypatch.setattr(jinja_renderer, "usable_cpu_count", lambda: 2)
+        monkeypatch.setattr(jinja_renderer, "_worth_pooling", lambda *args: True)
+        contributions = _contributions(2)
+        first = _render(tmp_path, contributions)
+        second = _render(tmp_path, contributions)
+        assert pool_starts == [2, 2]
+        assert second == first
+
+    def test_small_site_renders_serially(self, tmp_path, monkeypatch, pool_starts):
+        """A few short projects are not worth starting workers for."""
+        monkeypatch.setattr(jinja_renderer, "usable_cpu_count", lambda: 4)
+        site = _render(tmp_path, _contributions(3))
+        assert "proj-2/index.html" in site
+        assert pool_starts == []
+
+    def test_large_uncached_markdown_uses_pool(self, tmp_path):
+        contributions = _contributions(2)
+        big = "word " * (jinja_renderer._POOL_MIN_MARKDOWN_BYTES // 5)
+        contributions[1] = contributions[1].model_copy(update={"overview_md": big})
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        assert jinja_renderer._worth_pooling(contributions, cache_dir)
+
+        # Once converted, the same text no longer counts towards the pool.
+        (cache_dir / jinja_renderer._md_cache_name(big)).write_text("<p>x</p>")
+        assert not jinja_renderer._worth_pooling(contributions, cache_dir)
+
+
+class TestMarkdownCache:
+    """Converted markdown is cached on disk between renders."""
+
+    @pytest.fixture(autouse=True)
+    def _serial(self, monkeypatch):
+        monkeypatch.setattr(jinja_renderer, "usable_cpu_count", lambda: 1)
+
+    def _entries(self, workspace_root: Path) -> set[str]:
+        return {p.name for p in (workspace_root / ".md-cache" / CLIENT).iterdir()}
+
+    def test_unchanged_prose_is_read_from_cache(self, tmp_path, monkeypatch):
+        contributions = _contributions(1)
+        first = _render(tmp_path, contributions)
+
+        def _no_convert(text):
+            raise AssertionError("markdown converted despite a cache entry")
+
+        monkeypatch.setattr(jinja_renderer, "_md_to_html", _no_convert)
+        assert _render(tmp_path, contributions) == first
+
+    def test_edited_prose_is_converted_and_old_entry_pruned(self, tmp_path):
+        contributions = _contributions(1)
+        _render(tmp_path, contributions)
+        before = self._entries(tmp_path)
+        old_name = jinja_renderer._md_cache_name(contributions[0].overview_md)
+        assert old_name in before
+
+        edited = [contributions[0].model_copy(update={"overview_md": "Revised."})]
+        site = _render(tmp_path, edited)
+
+        assert b"Revised." in site["proj-0/index.html"]
+        after = self._entries(tmp_path)
+        assert old_name not in after
+        assert jinja_renderer._md_cache_name("Revised.") in after
+        assert len(after) == len(before)
+
+    def test_corrupt_entry_is_converted_and_replaced(self, tmp_path):
+        text = "Some *prose*."
+        entry = tmp_path / jinja_renderer._md_cache_name(text)
+        entry.write_bytes(b"\xff\xfe not utf-8")
+        html = jinja_renderer._md_to_html_cached(text, entry)
+        assert html == "<p>Some <em>prose</em>.</p>"
+        assert entry.read_text() == html
+
+    def test_unwritable_cache_falls_back_to_converting(self, tmp_path):
+        text = "Some *prose*."
+        entry = tmp_path / "missing" / jinja_renderer._md_cache_name(text)
+        html = jinja_renderer._md_to_html_cached(text, entry)
+        assert html == "<p>Some <em>prose</em>.</p>"
+        assert not entry.parent.exists()
+
+    def test_unreadable_entry_leaves_no_temp_file(self, tmp_path):
+        text = "Some *prose*."
+        entry = tmp_path / jinja_renderer._md_cache_name(text)
+        entry.mkdir()
+        html = jinja_renderer._md_to_html_cached(text, entry)
+        assert html == "<p>Some <em>prose</em>.</p>"
+        assert [p.name for p in tmp_path.iterdir()] == [entry.name]
+
+
+class TestBytecodeCache:
+    """Template bytecode is cached under the workspace, set up lazily."""
+
+    @pytest.fixture(autouse=True)
+    def _serial(self, monkeypatch):
+        monkeypatch.setattr(jinja_renderer, "usable_cpu_count", lambda: 1)
+
+    def test_created_on_first_render(self, tmp_path):
+        JinjaSiteRenderer(tmp_path, _REPO_ROOT)
+        assert not (tmp_path / ".jinja-cache").exists()
+        _render(tmp_path, _contributions(1))
+        assert any((tmp_path / ".jinja-cache").iterdir())
+
+    def test_unusable_cache_dir_renders_without_cache(self, tmp_path):
+        (tmp_path / ".jinja-cache").write_text("not a directory")
+        site = _render(tmp_path, _contributions(1))
+        assert "proj-0/index.html" in site
@@ -7,9 +7,16 @@ personal, and partnership BC packages).
 
 from __future__ import annotations
 
+import sys
+
 import pytest
 
-from practice.bc_discovery import collect_pipelines
+from practice.bc_discovery import (
+    collect_pipelines,
+    collect_pipelines_by_dir,
+    find_named,
+    skill_search_dirs,
+)
 from bin.cli.infrastructure.filesystem_source_repository import (
     FilesystemSourceRepository,
 )
@@ -350,6 +357,70 @@ class TestCollectPipelines:
         assert "alpha" in names
         assert "beta" in names
 
+    def test_by_dir_groups_in_input_order(self, tmp_path):
+        _write_bc_package(tmp_path / "one", "grp_one", [_make_pipeline_def("one")])
+        _write_bc_package(tmp_path / "two", "grp_two", [_make_pipeline_def("two")])
+        groups = collect_pipelines_by_dir(
+            [tmp_path / "two", tmp_path / "missing", tmp_path / "one"]
+        )
+        assert [[p.name for p in g] for g in groups] == [["two"], [], ["one"]]
+
+    def test_by_dir_prepends_source_dirs_in_input_order(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(sys, "path", list(sys.path))
+        _write_bc_package(tmp_path / "one", "ord_one", [_make_pipeline_def("o1")])
+        _write_bc_package(tmp_path / "two", "ord_two", [_make_pipeline_def("o2")])
+        collect_pipelines_by_dir([tmp_path / "two", tmp_path / "one"])
+        assert sys.path[:2] == [str(tmp_path / "two"), str(tmp_path / "one")]
+
+
+class TestFindNamed:
+    """Recursive literal-name file search."""
+
+    def test_matches_rglob_order(self, tmp_path):
+        for rel in ("b/SKILL.md", "a/b/SKILL.md", "a-b/SKILL.md", "SKILL.md"):
+            (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / rel).write_text("x")
+        (tmp_path / "c" / "SKILL.md").mkdir(parents=True)  # directory, not file
+        assert find_named(tmp_path, "SKILL.md") == sorted(
+            p for p in tmp_path.rglob("SKILL.md") if p.is_file()
+        )
+
+    def test_does_not_follow_directory_symlinks(self, tmp_path):
+        (tmp_path / "real").mkdir()
+        (tmp_path / "real" / "index.md").write_text("x")
+        (tmp_path / "link").symlink_to(tmp_path / "real")
+        assert find_named(tmp_path, "index.md") == [tmp_path / "real" / "index.md"]
+
+    def test_missing_root(self, tmp_path):
+        assert find_named(tmp_path / "nope", "index.md") == []
+
+
+class TestSkillSearchDirs:
+    """Memoised skill search directory listing."""
+
+    def test_sees_new_partnership(self, tmp_path):
+        (tmp_path / "partnerships").mkdir()
+        assert skill_search_dirs(tmp_path) == []
+        (tmp_path / "partnerships" / "acme").mkdir()
+        assert skill_search_dirs(tmp_path) == [tmp_path / "partnerships" / "acme"]
+
+    def test_sees_new_commons_repo(self, tmp_path):
+        org = tmp_path / "commons" / "org"
+        (org / "first" / "skillsets").mkdir(parents=True)
+        assert skill_search_dirs(tmp_path) == [org / "first" / "skillsets"]
+        (org / "second" / "skillsets").mkdir(parents=True)
+        assert skill_search_dirs(tmp_path) == [
+            org / "first" / "skillsets",
+            org / "second" / "skillsets",
+        ]
+
+    def test_sees_new_skillsets_in_existing_repo(self, tmp_path):
+        repo = tmp_path / "commons" / "org" / "repo"
+        repo.mkdir(parents=True)
+        assert skill_search_dirs(tmp_path) == []
+        (repo / "skillsets").mkdir()
+        assert skill_search_dirs(tmp_path) == [repo / "skillsets"]
+
 
 class TestDiscoveryFindsPipelines:
     """BC discovery finds PIPELINES attribute from modules."""